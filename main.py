@@ -1,6 +1,6 @@
 from src.api import HeadHunterAPI
 from src.vacancy import Vacancy
-from src.saver import JSONSaver
+from src.daemon import connect_saver
 from src.utils import filter_vacancies, sort_vacancies, get_top_vacancies, print_vacancies, get_vacancies_by_salary
 import os
 
@@ -36,8 +36,8 @@ def user_interaction():
         print("Не удалось обработать найденные вакансии.")
         return
 
-    # Шаг 4: Сохранение в файл
-    saver = JSONSaver()
+    # Шаг 4: Сохранение в файл (через демон, если он запущен)
+    saver = connect_saver()
     saver.add_vacancies(vacancies_list)
 
     # Шаг 5: Фильтрация по ключевым словам
@@ -19,8 +19,23 @@ class DataSaver(ABC):
         pass
 
     @abstractmethod
-    def get_vacancies(self, criteria: dict = None):
-        """Получить вакансии по критериям"""
+    def get_vacancies(self, criteria: dict = None, limit: int = None, offset: int = 0):
+        """Получить вакансии по критериям (limit/offset - страница результата)"""
+        pass
+
+    def iter_vacancies(self, criteria: dict = None):
+        """Лениво перебрать вакансии по критериям"""
+        return iter(self.get_vacancies(criteria))
+
+    @abstractmethod
+    def get_vacancies_by_salary_range(self, min_salary: float = 0, max_salary: float = float('inf'),
+                                      limit: int = None, offset: int = 0):
+        """
+        Получить вакансии по диапазону средней зарплаты (min_salary <= средняя <= max_salary)
+
+        Все хранилища возвращают результат в одном порядке: по убыванию средней
+        зарплаты, при равной зарплате - по URL (как get_top_vacancies_by_salary).
+        """
         pass
 
     @abstractmethod
@@ -31,4 +46,20 @@ class DataSaver(ABC):
     @abstractmethod
     def clear_file(self):
         """Очистить файл с вакансиями"""
-        pass
\ No newline at end of file
+        pass
+
+
+class VacancyListener(ABC):
+    """Абстрактный класс для подписчиков на изменения хранилища вакансий"""
+
+    def on_add(self, vacancies: list):
+        """Вызывается после сохранения новых вакансий (список словарей)"""
+        pass
+
+    def on_delete(self, vacancy: dict):
+        """Вызывается после удаления вакансии (словарь)"""
+        pass
+
+    def on_clear(self):
+        """Вызывается после очистки хранилища"""
+        pass
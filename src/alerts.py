@@ -0,0 +1,161 @@
+import bisect
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from src.abstract_classes import VacancyListener
+from src.vacancy import Vacancy
+
+_GRAM = 3
+
+VacancyLike = Union[Vacancy, Dict[str, Any]]
+
+
+def _vacancy_text_and_salary(vacancy: VacancyLike) -> Tuple[str, float]:
+    """Получить текст для поиска (как в filter_vacancies) и среднюю зарплату"""
+    if isinstance(vacancy, Vacancy):
+        text = f"{vacancy.title} {vacancy.description} {vacancy.employer}"
+        return text.lower(), vacancy.get_average_salary()
+    text = f"{vacancy.get('title', '')} {vacancy.get('description', '')} {vacancy.get('employer', '')}"
+    return text.lower(), vacancy.get('average_salary', 0)
+
+
+class SavedSearch:
+    """Сохраненный поиск: ключевые слова (любое из них) и диапазон зарплат"""
+
+    __slots__ = ('search_id', 'keywords', 'min_salary', 'max_salary')
+
+    def __init__(self, search_id: str, keywords: Iterable[str] = (),
+                 min_salary: Optional[float] = None, max_salary: Optional[float] = None):
+        self.search_id = search_id
+        self.keywords = tuple(dict.fromkeys(word.strip().lower() for word in keywords if word.strip()))
+        self.min_salary = min_salary
+        self.max_salary = max_salary
+
+    def salary_matches(self, salary: float) -> bool:
+        """Проверить зарплату (как get_vacancies_by_salary: min <= средняя <= max)"""
+        if self.min_salary is None and self.max_salary is None:
+            return True
+        low = self.min_salary if self.min_salary is not None else 0
+        high = self.max_salary if self.max_salary is not None else float('inf')
+        return low <= salary <= high
+
+    def matches(self, text: str, salary: float) -> bool:
+        """Проверить вакансию по подготовленному тексту в нижнем регистре и зарплате"""
+        if self.keywords and not any(word in text for word in self.keywords):
+            return False
+        return self.salary_matches(salary)
+
+
+class SearchPercolator(VacancyListener):
+    """
+    Обратный поиск: сопоставление новых вакансий с сохраненными поисками
+
+    Индексируются сами поиски. Каждое ключевое слово попадает в индекс по одной
+    своей триграмме (выбирается наименее занятая), поэтому вакансия проверяется
+    только по тем поискам, триграммы которых встречаются в ее тексте. Поиски без
+    ключевых слов хранятся в списке, отсортированном по минимальной зарплате.
+    Найденные кандидаты проверяются точно, с той же семантикой, что у
+    filter_vacancies и get_vacancies_by_salary.
+
+    При подписке на хранилище (JSONSaver.add_listener) новые вакансии проверяются
+    сразу после add_vacancies, для каждого совпадения вызывается notify.
+    """
+
+    def __init__(self, notify: Optional[Callable[[str, Dict[str, Any]], None]] = None):
+        """
+        Инициализация
+
+        Args:
+            notify: Функция (идентификатор поиска, вакансия), вызываемая при совпадении
+        """
+        self.notify = notify or (lambda search_id, vacancy:
+                                 print(f"Поиск '{search_id}': новая вакансия '{vacancy.get('title', '')}'"))
+        self.__searches: Dict[str, SavedSearch] = {}
+        self.__gram_index: Dict[str, Set[str]] = {}
+        self.__search_grams: Dict[str, List[str]] = {}
+        self.__short_keyword_searches: Set[str] = set()
+        self.__salary_only: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.__searches)
+
+    def add_search(self, search_id: str, keywords: Iterable[str] = (),
+                   min_salary: Optional[float] = None, max_salary: Optional[float] = None):
+        """
+        Сохранить поиск (поиск с тем же идентификатором заменяется)
+
+        Args:
+            search_id: Идентификатор поиска
+            keywords: Ключевые слова (совпадение по любому из них)
+            min_salary: Минимальная средняя зарплата
+            max_salary: Максимальная средняя зарплата
+        """
+        self.remove_search(search_id)
+        search = SavedSearch(search_id, keywords, min_salary, max_salary)
+        self.__searches[search_id] = search
+
+        if not search.keywords:
+            bisect.insort(self.__salary_only, (search.min_salary or 0, search_id))
+            return
+
+        grams = []
+        for word in search.keywords:
+            if len(word) < _GRAM:
+                self.__short_keyword_searches.add(search_id)
+                continue
+            candidates = {word[i:i + _GRAM] for i in range(len(word) - _GRAM + 1)}
+            gram = min(candidates, key=lambda g: (len(self.__gram_index.get(g, ())), g))
+            self.__gram_index.setdefault(gram, set()).add(search_id)
+            grams.append(gram)
+        self.__search_grams[search_id] = grams
+
+    def remove_search(self, search_id: str):
+        """Удалить сохраненный поиск"""
+        search = self.__searches.pop(search_id, None)
+        if search is None:
+            return
+
+        if not search.keywords:
+            self.__salary_only.remove((search.min_salary or 0, search_id))
+            return
+
+        self.__short_keyword_searches.discard(search_id)
+        for gram in self.__search_grams.pop(search_id, []):
+            ids = self.__gram_index[gram]
+            ids.discard(search_id)
+            if not ids:
+                del self.__gram_index[gram]
+
+    def match(self, vacancy: VacancyLike) -> List[str]:
+        """
+        Найти сохраненные поиски, которым соответствует вакансия
+
+        Args:
+            vacancy: Объект Vacancy или словарь вакансии
+
+        Returns:
+            Список идентификаторов поисков
+        """
+        text, salary = _vacancy_text_and_salary(vacancy)
+
+        candidates = set(self.__short_keyword_searches)
+        gram_index = self.__gram_index
+        if gram_index:
+            for i in range(len(text) - _GRAM + 1):
+                ids = gram_index.get(text[i:i + _GRAM])
+                if ids:
+                    candidates.update(ids)
+
+        matched = [search_id for search_id in candidates
+                   if self.__searches[search_id].matches(text, salary)]
+
+        # Поиски только по зарплате: кандидаты - все с минимальной зарплатой не выше средней
+        end = bisect.bisect_right(self.__salary_only, (salary, chr(0x10FFFF)))
+        matched.extend(search_id for _, search_id in self.__salary_only[:end]
+                       if self.__searches[search_id].salary_matches(salary))
+        return matched
+
+    def on_add(self, vacancies: list):
+        """Проверить новые вакансии и уведомить о совпадениях"""
+        for vacancy in vacancies:
+            for search_id in self.match(vacancy):
+                self.notify(search_id, vacancy)
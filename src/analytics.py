@@ -0,0 +1,203 @@
+import math
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.abstract_classes import VacancyListener
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_title(title: str) -> str:
+    """Нормализовать название вакансии: нижний регистр, только слова"""
+    return " ".join(_WORD_RE.findall(title.lower()))
+
+
+class SalarySummary:
+    """
+    Инкрементальная сводка по зарплатам одной группы
+
+    Хранит количество, сумму и логарифмическую гистограмму (квантильный скетч
+    с относительной погрешностью). В отличие от большинства потоковых скетчей
+    она поддерживает удаление значений. Отсортированный список корзин кэшируется
+    и сбрасывается только при появлении или исчезновении корзины.
+    """
+
+    __slots__ = ('count', 'total', '_gamma', '_log_gamma', '_buckets', '_sorted_buckets')
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """
+        Инициализация сводки
+
+        Args:
+            relative_accuracy: Относительная погрешность квантилей
+        """
+        self.count = 0
+        self.total = 0.0
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._sorted_buckets: Optional[List[int]] = None
+
+    def _bucket(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _bucket_value(self, index: int) -> float:
+        """Представитель корзины с относительной погрешностью не больше заданной"""
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+    def add(self, value: float):
+        """Добавить значение"""
+        index = self._bucket(value)
+        if index not in self._buckets:
+            self._sorted_buckets = None
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+
+    def remove(self, value: float):
+        """Удалить ранее добавленное значение"""
+        index = self._bucket(value)
+        left = self._buckets.get(index, 0) - 1
+        if left < 0:
+            return
+        if left:
+            self._buckets[index] = left
+        else:
+            del self._buckets[index]
+            self._sorted_buckets = None
+        self.count -= 1
+        self.total -= value
+
+    @property
+    def mean(self) -> float:
+        """Средняя зарплата"""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Получить квантиль зарплаты
+
+        Args:
+            q: Уровень квантиля от 0 до 1
+
+        Returns:
+            Приближенное значение квантиля (0.0 для пустой группы)
+        """
+        if not self.count:
+            return 0.0
+        if self._sorted_buckets is None:
+            self._sorted_buckets = sorted(self._buckets)
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in self._sorted_buckets:
+            seen += self._buckets[index]
+            if seen > rank:
+                return self._bucket_value(index)
+        return self._bucket_value(self._sorted_buckets[-1])
+
+    @property
+    def median(self) -> float:
+        """Медианная зарплата"""
+        return self.quantile(0.5)
+
+    def histogram(self, bin_width: float) -> Dict[float, int]:
+        """
+        Получить гистограмму зарплат с заданной шириной интервала
+
+        Args:
+            bin_width: Ширина интервала
+
+        Returns:
+            Словарь {начало интервала: количество вакансий}
+        """
+        bins: Dict[float, int] = {}
+        for index, count in self._buckets.items():
+            start = (self._bucket_value(index) // bin_width) * bin_width
+            bins[start] = bins.get(start, 0) + count
+        return dict(sorted(bins.items()))
+
+
+class SalaryAnalytics(VacancyListener):
+    """
+    Инкрементальная аналитика зарплат по сохраненным вакансиям
+
+    Сводки ведутся по группам (измерение, значение, валюта). Измерения:
+        all: все вакансии (значение - пустая строка)
+        employer: работодатель
+        title: нормализованное название вакансии
+        word: отдельное слово из названия (например, "python")
+
+    Учитываются только вакансии с указанной зарплатой. Чтобы сводки обновлялись
+    автоматически, объект подписывается на хранилище через JSONSaver.add_listener.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.__summaries: Dict[Tuple[str, str, str], SalarySummary] = {}
+
+    @classmethod
+    def from_records(cls, vacancies: Iterable[Dict[str, Any]], relative_accuracy: float = 0.01) -> "SalaryAnalytics":
+        """Построить аналитику по уже сохраненным вакансиям (однократно)"""
+        analytics = cls(relative_accuracy)
+        analytics.on_add(vacancies)
+        return analytics
+
+    @staticmethod
+    def _groups(vacancy: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+        """Получить группы, в которые входит вакансия"""
+        currency = vacancy.get('salary', {}).get('currency', '')
+        title = normalize_title(vacancy.get('title', ''))
+        groups = [("all", "", currency),
+                  ("employer", vacancy.get('employer', ''), currency),
+                  ("title", title, currency)]
+        groups.extend(("word", word, currency) for word in set(title.split()))
+        return groups
+
+    def on_add(self, vacancies: Iterable[Dict[str, Any]]):
+        """Учесть новые вакансии"""
+        for vacancy in vacancies:
+            salary = vacancy.get('average_salary', 0)
+            if salary <= 0:
+                continue
+            for group in self._groups(vacancy):
+                summary = self.__summaries.get(group)
+                if summary is None:
+                    summary = self.__summaries[group] = SalarySummary(self.relative_accuracy)
+                summary.add(salary)
+
+    def on_delete(self, vacancy: Dict[str, Any]):
+        """Исключить удаленную вакансию"""
+        salary = vacancy.get('average_salary', 0)
+        if salary <= 0:
+            return
+        for group in self._groups(vacancy):
+            summary = self.__summaries.get(group)
+            if summary is not None:
+                summary.remove(salary)
+                if not summary.count:
+                    del self.__summaries[group]
+
+    def on_clear(self):
+        """Сбросить все сводки"""
+        self.__summaries.clear()
+
+    def summary(self, dimension: str = "all", value: str = "", currency: str = "RUR") -> Optional[SalarySummary]:
+        """
+        Получить сводку по группе
+
+        Args:
+            dimension: Измерение (all, employer, title, word)
+            value: Значение измерения (название и слова нормализуются автоматически)
+            currency: Валюта
+
+        Returns:
+            Сводка или None, если в группе нет вакансий с зарплатой
+        """
+        if dimension in ("title", "word"):
+            value = normalize_title(value)
+        return self.__summaries.get((dimension, value, currency))
+
+    def median(self, dimension: str = "all", value: str = "", currency: str = "RUR") -> float:
+        """Получить медианную зарплату по группе (0.0, если данных нет)"""
+        summary = self.summary(dimension, value, currency)
+        return summary.median if summary else 0.0
@@ -1,13 +1,73 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
 import requests
 from src.abstract_classes import APIHandler
-from typing import Dict, List, Any
+
+
+class RateLimiter:
+    """
+    Потокобезопасный ограничитель частоты запросов
+
+    Один ограничитель можно передать в несколько вызовов search_batch, чтобы
+    общая частота запросов не превышала лимит.
+    """
+
+    def __init__(self, requests_per_second: Optional[float] = None):
+        self.__interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self.__lock = threading.Lock()
+        self.__next_slot = 0.0
+
+    def wait(self):
+        """Дождаться момента, когда разрешено отправить следующий запрос"""
+        with self.__lock:
+            now = time.monotonic()
+            slot = max(now, self.__next_slot)
+            self.__next_slot = slot + self.__interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds: float):
+        """Не отправлять запросы указанное время (например, по заголовку Retry-After)"""
+        with self.__lock:
+            self.__next_slot = max(self.__next_slot, time.monotonic() + seconds)
+
+
+def _retry_delay(error: requests.RequestException, attempt: int, backoff: float) -> Optional[float]:
+    """
+    Задержка перед повтором запроса
+
+    Повторяются ошибки соединения и ответы 429 и 5xx. Для ответа с заголовком
+    Retry-After (в секундах) используется его значение, иначе - экспоненциальная задержка.
+
+    Returns:
+        Задержка в секундах или None, если запрос повторять не нужно
+    """
+    response = error.response
+    if response is None:
+        return backoff * 2 ** attempt if isinstance(error, (requests.ConnectionError, requests.Timeout)) else None
+    if response.status_code != 429 and response.status_code < 500:
+        return None
+    try:
+        return max(float(response.headers.get('Retry-After', '')), 0.0)
+    except ValueError:
+        return backoff * 2 ** attempt
 
 
 class HeadHunterAPI(APIHandler):
     """Класс для работы с API HeadHunter"""
 
-    def __init__(self):
-        self.__base_url = "https://api.hh.ru/vacancies"  # Приватный атрибут
+    def __init__(self, base_url: str = "https://api.hh.ru/vacancies"):
+        """
+        Инициализация клиента
+
+        Args:
+            base_url: Адрес метода вакансий (например, локальной заглушки из src.replay)
+        """
+        self.__base_url = base_url  # Приватный атрибут
         self.__headers = {'User-Agent': 'HH-User-Agent'}  # Приватный атрибут
 
     def get_vacancies(self, search_query: str, area: str = "113") -> List[Dict[str, Any]]:
@@ -21,6 +81,14 @@ class HeadHunterAPI(APIHandler):
         Returns:
             Список вакансий в формате JSON
         """
+        try:
+            return self._fetch_vacancies(search_query, area)
+        except requests.RequestException as e:
+            print(f"Ошибка при получении вакансий: {e}")
+            return []
+
+    def _fetch_vacancies(self, search_query: str, area: str) -> List[Dict[str, Any]]:
+        """Получить вакансии, пробрасывая ошибки запроса (requests.RequestException)"""
         params = {
             'text': search_query,
             'area': area,
@@ -28,14 +96,11 @@ class HeadHunterAPI(APIHandler):
             'page': 0
         }
 
-        try:
-            # Используем приватный метод для подключения
-            response = self.__connect_to_api(params)
-            data = response.json()
-            return data.get('items', [])
-        except requests.RequestException as e:
-            print(f"Ошибка при получении вакансий: {e}")
-            return []
+        # Используем приватный метод для подключения
+        response = self.__connect_to_api(params)
+        response.raise_for_status()
+        data = response.json()
+        return data.get('items', [])
 
     def __connect_to_api(self, params: dict):
         """Приватный метод для подключения к API"""
@@ -50,4 +115,77 @@ class HeadHunterAPI(APIHandler):
             return response.json()
         except requests.RequestException as e:
             print(f"Ошибка при получении деталей вакансии: {e}")
-            return {}
\ No newline at end of file
+            return {}
+
+    def search_batch(self, search_queries: Iterable[str], areas: Iterable[str] = ("113",),
+                     max_workers: int = 8, requests_per_second: Optional[float] = None,
+                     limiter: Optional[RateLimiter] = None, max_retries: int = 3, backoff: float = 0.5,
+                     failed: Optional[List[Tuple[str, str]]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Получить вакансии по всем сочетаниям запросов и регионов
+
+        Запросы выполняются параллельно с общим ограничением числа потоков и частоты.
+        Вакансии, найденные по нескольким запросам, возвращаются один раз
+        (по полю id, а при его отсутствии - по alternate_url) еще до преобразования
+        в объекты Vacancy. Результаты отдаются по мере поступления.
+
+        Ответы 429 и 5xx и ошибки соединения повторяются с экспоненциальной задержкой;
+        заголовок Retry-After ответа 429 приостанавливает все запросы через ограничитель.
+        Пары, не получившие ответа после всех повторов, добавляются в failed.
+
+        Args:
+            search_queries: Поисковые запросы
+            areas: Коды регионов
+            max_workers: Максимальное число одновременных запросов
+            requests_per_second: Ограничение частоты запросов (None - без ограничения)
+            limiter: Общий ограничитель частоты (вместо requests_per_second)
+            max_retries: Количество повторов запроса
+            backoff: Начальная задержка перед повтором в секундах
+            failed: Список для пар (поисковый запрос, регион), которые не удалось получить
+
+        Yields:
+            Уникальные вакансии в формате JSON
+        """
+        areas = list(areas)
+        limiter = limiter or RateLimiter(requests_per_second)
+        seen = set()
+
+        def fetch(search_query: str, area: str) -> List[Dict[str, Any]]:
+            for attempt in range(max_retries + 1):
+                limiter.wait()
+                try:
+                    return self._fetch_vacancies(search_query, area)
+                except requests.RequestException as e:
+                    delay = _retry_delay(e, attempt, backoff)
+                    if delay is None or attempt == max_retries:
+                        raise
+                    if e.response is not None and e.response.status_code == 429:
+                        limiter.pause(delay)
+                    else:
+                        time.sleep(delay)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(fetch, search_query, area): (search_query, area)
+                       for search_query in dict.fromkeys(search_queries)
+                       for area in dict.fromkeys(areas)}
+            try:
+                for future in as_completed(futures):
+                    try:
+                        items = future.result()
+                    except requests.RequestException as e:
+                        print(f"Ошибка при получении вакансий по запросу '{futures[future][0]}' "
+                              f"(регион {futures[future][1]}): {e}")
+                        if failed is not None:
+                            failed.append(futures[future])
+                        continue
+                    for item in items:
+                        key = item.get('id') or item.get('alternate_url')
+                        if key is None:
+                            yield item
+                        elif key not in seen:
+                            seen.add(key)
+                            yield item
+            finally:
+                # Если вызывающий код прекратил чтение, не отправляем оставшиеся запросы
+                for future in futures:
+                    future.cancel()
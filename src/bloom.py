@@ -0,0 +1,171 @@
+import hashlib
+import math
+import os
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from src.abstract_classes import DataSaver, VacancyListener
+
+_HEADER = struct.Struct("<QII")  # Количество бит, количество хэш-функций, количество элементов
+
+
+class BloomFilter:
+    """
+    Фильтр Блума для компактной проверки принадлежности множеству
+
+    Ложноотрицательных ответов не бывает: если элемент добавлялся, проверка
+    всегда вернет True. Ложноположительные ответы возможны с заданной вероятностью,
+    пока количество элементов не превышает расчетную емкость.
+    """
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.01):
+        """
+        Инициализация фильтра
+
+        Args:
+            capacity: Расчетное количество элементов
+            error_rate: Допустимая доля ложноположительных ответов
+        """
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("Некорректные параметры фильтра Блума")
+        num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self._init(num_bits, num_hashes, 0, bytearray((num_bits + 7) // 8))
+
+    def _init(self, num_bits: int, num_hashes: int, count: int, bits: bytearray):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.count = count
+        self.__bits = bits
+
+    def _positions(self, key: str):
+        # Двойное хэширование: позиции h1 + i * h2 по двум половинам одного дайджеста
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        h2 |= 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str):
+        """Добавить элемент"""
+        bits = self.__bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.__bits
+        for position in self._positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        return self.count
+
+    def save(self, filename: str):
+        """Сохранить фильтр в файл"""
+        tmp_filename = f"{filename}.tmp"
+        with open(tmp_filename, 'wb') as file:
+            file.write(_HEADER.pack(self.num_bits, self.num_hashes, self.count))
+            file.write(self.__bits)
+        os.replace(tmp_filename, filename)
+
+    @classmethod
+    def load(cls, filename: str) -> "BloomFilter":
+        """Загрузить фильтр из файла"""
+        with open(filename, 'rb') as file:
+            num_bits, num_hashes, count = _HEADER.unpack(file.read(_HEADER.size))
+            bits = bytearray(file.read())
+        if len(bits) != (num_bits + 7) // 8:
+            raise ValueError(f"Поврежденный файл фильтра Блума: {filename}")
+        bloom = cls.__new__(cls)
+        bloom._init(num_bits, num_hashes, count, bits)
+        return bloom
+
+
+def _item_key(item: Dict[str, Any]) -> str:
+    """Ключ вакансии из ответа API (совпадает с полем url сохраненной вакансии)"""
+    return item.get('alternate_url', '')
+
+
+class SeenVacancyFilter(VacancyListener):
+    """
+    Фильтр уже сохраненных вакансий для сырых ответов API
+
+    Проверка выполняется до преобразования в объекты Vacancy. Если фильтр Блума
+    отвечает "не встречалась", вакансия точно новая. Положительные ответы
+    проверяются точно за один потоковый проход по хранилищу на вызов filter_new,
+    полный набор URL в памяти не хранится.
+    Вакансия с уже сохраненным URL отбрасывается, даже если ее поля изменились.
+
+    Фильтр подписывается на хранилище через JSONSaver.add_listener и сохраняется
+    в файл после каждого добавления.
+    """
+
+    def __init__(self, saver: DataSaver, filename: Optional[str] = None,
+                 capacity: int = 100000, error_rate: float = 0.01):
+        """
+        Инициализация фильтра
+
+        Args:
+            saver: Хранилище вакансий для точной проверки
+            filename: Файл фильтра Блума (если не существует - строится по хранилищу)
+            capacity: Расчетное количество вакансий
+            error_rate: Допустимая доля ложноположительных ответов
+        """
+        self.__saver = saver
+        self.__filename = filename
+        self.__capacity = capacity
+        self.__error_rate = error_rate
+
+        if filename and os.path.exists(filename):
+            self.bloom = BloomFilter.load(filename)
+        else:
+            self.bloom = BloomFilter(capacity, error_rate)
+            for vacancy in saver.iter_vacancies():
+                self.bloom.add(vacancy.get('url', ''))
+            self._save()
+
+    def _save(self):
+        if self.__filename:
+            self.bloom.save(self.__filename)
+
+    def _stored_urls(self, urls: Set[str]) -> Set[str]:
+        """Точная проверка: найти URL из набора, которые есть в хранилище"""
+        pending = set(urls)
+        stored = set()
+        for vacancy in self.__saver.iter_vacancies():
+            url = vacancy.get('url', '')
+            if url in pending:
+                pending.remove(url)
+                stored.add(url)
+                if not pending:
+                    break
+        return stored
+
+    def filter_new(self, items: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Оставить только вакансии, которых еще нет в хранилище
+
+        Args:
+            items: Вакансии в формате ответа API
+
+        Returns:
+            Список новых вакансий в формате ответа API
+        """
+        items = list(items)
+        candidates = {_item_key(item) for item in items if _item_key(item) in self.bloom}
+        stored = self._stored_urls(candidates) if candidates else set()
+        return [item for item in items if _item_key(item) not in stored]
+
+    def on_add(self, vacancies: list):
+        """Запомнить URL сохраненных вакансий"""
+        for vacancy in vacancies:
+            self.bloom.add(vacancy.get('url', ''))
+        self._save()
+
+    def on_clear(self):
+        """Сбросить фильтр"""
+        self.bloom = BloomFilter(self.__capacity, self.__error_rate)
+        self._save()
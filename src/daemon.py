@@ -0,0 +1,356 @@
+import argparse
+import bisect
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.abstract_classes import DataSaver
+from src.query import compile_criteria
+from src.saver import JSONSaver, paginate, record_key, salary_order
+from src.vacancy import Vacancy
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+def _check_record(vacancy: Any):
+    """Проверить, что запись вакансии можно сохранить и упорядочить по зарплате"""
+    if not isinstance(vacancy, dict):
+        raise ValueError(f"Вакансия должна быть JSON объектом, получено: {type(vacancy).__name__}")
+    salary = vacancy.get('average_salary', 0)
+    if isinstance(salary, bool) or not isinstance(salary, (int, float)):
+        raise ValueError("Поле 'average_salary' должно быть числом")
+    if not isinstance(vacancy.get('url', ''), str):
+        raise ValueError("Поле 'url' должно быть строкой")
+
+
+class VacancyStore:
+    """
+    Хранилище вакансий в памяти для демона
+
+    Файл читается один раз при запуске, после чего все запросы обслуживаются из памяти.
+    Вакансии дополнительно хранятся в списке, отсортированном по убыванию зарплаты,
+    поэтому топ N и выборка по диапазону зарплат не требуют полного просмотра.
+    Изменения сразу записываются в файл; пока демон запущен, он должен быть
+    единственным, кто изменяет файл.
+    """
+
+    def __init__(self, saver: JSONSaver):
+        self.__saver = saver
+        self.__lock = threading.RLock()
+        self.__vacancies: List[Dict[str, Any]] = saver._load_vacancies()
+        self.__keys = {record_key(vacancy) for vacancy in self.__vacancies}
+        self.__by_salary = sorted(self.__vacancies, key=salary_order)
+
+    def __len__(self) -> int:
+        return len(self.__vacancies)
+
+    def get_vacancies(self, criteria: dict = None, limit: Optional[int] = None,
+                      offset: int = 0) -> List[Dict[str, Any]]:
+        with self.__lock:
+            if not criteria:
+                return paginate(self.__vacancies, limit, offset)
+            predicate = compile_criteria(criteria)
+            return paginate((v for v in self.__vacancies if predicate(v)), limit, offset)
+
+    def get_vacancies_by_salary_range(self, min_salary: float = 0, max_salary: float = float('inf'),
+                                      limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        with self.__lock:
+            start = bisect.bisect_left(self.__by_salary, (-max_salary, ''), key=salary_order)
+            found = []
+            skipped = 0
+            for vacancy in self.__by_salary[start:]:
+                if vacancy.get('average_salary', 0) < min_salary or (limit is not None and len(found) >= limit):
+                    break
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                found.append(vacancy)
+            return found
+
+    def get_top_vacancies_by_salary(self, n: int, after: Optional[Tuple[float, str]] = None) -> List[Dict[str, Any]]:
+        with self.__lock:
+            start = 0
+            if after is not None:
+                start = bisect.bisect_right(self.__by_salary, (-after[0], after[1]), key=salary_order)
+            top = []
+            for vacancy in self.__by_salary[start:start + max(n, 0)]:
+                if vacancy.get('average_salary', 0) <= 0:
+                    break
+                top.append(vacancy)
+            return top
+
+    def add_vacancies(self, vacancies: List[Dict[str, Any]]) -> int:
+        # Все записи проверяются до изменения хранилища, чтобы некорректная запись
+        # не попала ни в память, ни в файл
+        for vacancy in vacancies:
+            _check_record(vacancy)
+
+        with self.__lock:
+            added = 0
+            for vacancy in vacancies:
+                key = record_key(vacancy)
+                if key in self.__keys:
+                    continue
+                self.__keys.add(key)
+                self.__vacancies.append(vacancy)
+                bisect.insort(self.__by_salary, vacancy, key=salary_order)
+                added += 1
+            if added:
+                self.__saver._save_vacancies(self.__vacancies)
+            return added
+
+    def delete_vacancy(self, vacancy: Dict[str, Any]) -> bool:
+        with self.__lock:
+            key = record_key(vacancy)
+            if key not in self.__keys:
+                return False
+            self.__keys.remove(key)
+            self.__vacancies.remove(vacancy)
+            self.__by_salary.remove(vacancy)
+            self.__saver._save_vacancies(self.__vacancies)
+            return True
+
+    def clear(self):
+        with self.__lock:
+            self.__vacancies.clear()
+            self.__keys.clear()
+            self.__by_salary.clear()
+            self.__saver._save_vacancies([])
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Обработчик HTTP запросов демона: POST /<команда> с JSON телом"""
+
+    store: VacancyStore
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, payload: Dict[str, Any]):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/ping":
+            self._reply(200, {"result": len(self.store)})
+        else:
+            self._reply(404, {"error": "Неизвестная команда"})
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            params = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(params, dict):
+                raise ValueError("Тело запроса должно быть JSON объектом")
+            result = self._dispatch(self.path.strip("/"), params)
+        except KeyError:
+            self._reply(404, {"error": "Неизвестная команда"})
+        except (ValueError, TypeError) as e:
+            self._reply(400, {"error": str(e)})
+        else:
+            self._reply(200, {"result": result})
+
+    @staticmethod
+    def _required(params: Dict[str, Any], name: str) -> Any:
+        if name not in params:
+            raise ValueError(f"Не указан параметр '{name}'")
+        return params[name]
+
+    @staticmethod
+    def _criteria(params: Dict[str, Any]) -> Optional[dict]:
+        criteria = params.get("criteria")
+        if criteria is not None and not isinstance(criteria, dict):
+            raise ValueError("Параметр 'criteria' должен быть JSON объектом")
+        return criteria
+
+    @classmethod
+    def _vacancy(cls, params: Dict[str, Any]) -> Dict[str, Any]:
+        vacancy = cls._required(params, "vacancy")
+        if not isinstance(vacancy, dict):
+            raise ValueError("Параметр 'vacancy' должен быть JSON объектом")
+        return vacancy
+
+    @classmethod
+    def _vacancies(cls, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        vacancies = cls._required(params, "vacancies")
+        if not isinstance(vacancies, list) or not all(isinstance(v, dict) for v in vacancies):
+            raise ValueError("Параметр 'vacancies' должен быть списком JSON объектов")
+        return vacancies
+
+    @staticmethod
+    def _number(params: Dict[str, Any], name: str, default: Any) -> Any:
+        value = params.get(name, default)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Параметр '{name}' должен быть числом")
+        return value
+
+    @classmethod
+    def _page(cls, params: Dict[str, Any]) -> Tuple[Optional[int], int]:
+        limit, offset = params.get("limit"), params.get("offset", 0)
+        for name, value in (("limit", limit), ("offset", offset)):
+            if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 0):
+                raise ValueError(f"Параметр '{name}' должен быть неотрицательным целым числом")
+        return limit, offset or 0
+
+    @staticmethod
+    def _cursor(params: Dict[str, Any]) -> Optional[Tuple[float, str]]:
+        after = params.get("after")
+        if not after:
+            return None
+        if not isinstance(after, list) or len(after) != 2:
+            raise ValueError("Параметр 'after' должен быть парой [зарплата, url]")
+        return after[0], after[1]
+
+    def _dispatch(self, command: str, params: Dict[str, Any]) -> Any:
+        store = self.store
+        if command == "search":
+            return store.get_vacancies(self._criteria(params), *self._page(params))
+        if command == "salary_range":
+            return store.get_vacancies_by_salary_range(self._number(params, "min_salary", 0),
+                                                       self._number(params, "max_salary", float('inf')),
+                                                       *self._page(params))
+        if command == "top":
+            return store.get_top_vacancies_by_salary(self._required(params, "n"), self._cursor(params))
+        if command == "add":
+            return store.add_vacancies(self._vacancies(params))
+        if command == "delete":
+            return store.delete_vacancy(self._vacancy(params))
+        if command == "clear":
+            store.clear()
+            return True
+        raise KeyError(command)
+
+
+def create_server(filename: str = "data/vacancies.json", host: str = DEFAULT_HOST,
+                  port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """
+    Создать HTTP сервер демона, загрузив хранилище в память
+
+    Args:
+        filename: Путь к файлу с вакансиями
+        host: Адрес для прослушивания
+        port: Порт (0 - выбрать свободный)
+
+    Returns:
+        Сервер, готовый к вызову serve_forever()
+    """
+    handler = type("RequestHandler", (_RequestHandler,), {"store": VacancyStore(JSONSaver(filename))})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+class DaemonClient(DataSaver):
+    """Клиент демона с интерфейсом, совместимым с JSONSaver"""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, timeout: float = 5.0):
+        self.__base_url = f"http://{host}:{port}"
+        self.__timeout = timeout
+
+    def _call(self, command: str, **params) -> Any:
+        request = urllib.request.Request(f"{self.__base_url}/{command}",
+                                         data=json.dumps(params, ensure_ascii=False).encode('utf-8'),
+                                         headers={'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(request, timeout=self.__timeout) as response:
+                return json.load(response)["result"]
+        except urllib.error.HTTPError as e:
+            raise ValueError(json.load(e).get("error", str(e)))
+
+    def is_available(self) -> bool:
+        """Проверить, что демон запущен"""
+        try:
+            with urllib.request.urlopen(f"{self.__base_url}/ping", timeout=self.__timeout):
+                return True
+        except OSError:
+            return False
+
+    def add_vacancy(self, vacancy: Vacancy):
+        """Добавить вакансию"""
+        if self._call("add", vacancies=[vacancy.to_dict()]):
+            print(f"Вакансия '{vacancy.title}' добавлена.")
+        else:
+            print(f"Вакансия '{vacancy.title}' уже существует в файле.")
+
+    def add_vacancies(self, vacancies: List[Vacancy]):
+        """Добавить несколько вакансий"""
+        added = self._call("add", vacancies=[vacancy.to_dict() for vacancy in vacancies])
+        if added:
+            print(f"Добавлено {added} вакансий.")
+        else:
+            print("Нет новых вакансий для добавления.")
+
+    def get_vacancies(self, criteria: dict = None, limit: Optional[int] = None,
+                      offset: int = 0) -> List[Dict[str, Any]]:
+        """Получить вакансии по критериям"""
+        return self._call("search", criteria=criteria, limit=limit, offset=offset)
+
+    def get_vacancies_by_salary_range(self, min_salary: float = 0, max_salary: Optional[float] = None,
+                                      limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        """Получить вакансии по диапазону зарплат (по убыванию зарплаты)"""
+        params = {"min_salary": min_salary, "limit": limit, "offset": offset}
+        if max_salary is not None and max_salary != float('inf'):
+            params["max_salary"] = max_salary
+        return self._call("salary_range", **params)
+
+    def get_top_vacancies_by_salary(self, n: int, after: Optional[Tuple[float, str]] = None) -> List[Dict[str, Any]]:
+        """Получить топ N вакансий по зарплате"""
+        return self._call("top", n=n, after=list(after) if after else None)
+
+    def delete_vacancy(self, vacancy: Vacancy):
+        """Удалить вакансию"""
+        if self._call("delete", vacancy=vacancy.to_dict()):
+            print(f"Вакансия '{vacancy.title}' удалена.")
+        else:
+            print(f"Вакансия '{vacancy.title}' не найдена в файле.")
+
+    def clear_file(self):
+        """Очистить хранилище"""
+        self._call("clear")
+        print("Файл с вакансиями очищен.")
+
+
+def connect_saver(filename: str = "data/vacancies.json", host: str = DEFAULT_HOST,
+                  port: int = DEFAULT_PORT) -> DataSaver:
+    """
+    Получить клиент демона, если он запущен, иначе - обычный JSONSaver
+
+    Args:
+        filename: Путь к файлу для JSONSaver
+        host: Адрес демона
+        port: Порт демона
+
+    Returns:
+        Объект для работы с вакансиями
+    """
+    client = DaemonClient(host, port, timeout=0.5)
+    if client.is_available():
+        return DaemonClient(host, port)
+    return JSONSaver(filename)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Демон для быстрых запросов к сохраненным вакансиям")
+    parser.add_argument("--file", default="data/vacancies.json", help="Файл с вакансиями")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    server = create_server(args.file, args.host, args.port)
+    print(f"Демон запущен на http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+import random
+import re
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from src.vacancy import Vacancy
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_RE = re.compile(r"\w+")
+
+VacancyLike = Union[Vacancy, Dict[str, Any]]
+
+
+def _vacancy_fields(vacancy: VacancyLike) -> Tuple[str, str]:
+    """Получить (ключ, текст) для объекта Vacancy или словаря из файла"""
+    if isinstance(vacancy, Vacancy):
+        return vacancy.url, f"{vacancy.title} {vacancy.description} {vacancy.employer}"
+    return (vacancy.get('url', ''),
+            f"{vacancy.get('title', '')} {vacancy.get('description', '')} {vacancy.get('employer', '')}")
+
+
+class NearDuplicateDetector:
+    """
+    Поиск почти одинаковых вакансий с помощью MinHash и LSH
+
+    Текст вакансии (название, описание, работодатель) разбивается на словесные шинглы,
+    по ним строится MinHash-подпись. Подпись делится на полосы, и каждая полоса
+    попадает в свою хэш-таблицу, поэтому при добавлении сравниваются только
+    вакансии, совпавшие хотя бы в одной полосе.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, bands: int = 16,
+                 shingle_size: int = 3, seed: int = 1):
+        """
+        Инициализация детектора
+
+        Args:
+            threshold: Минимальное сходство (оценка коэффициента Жаккара) для дубликата
+            num_perm: Длина MinHash-подписи
+            bands: Количество полос LSH (num_perm должно делиться на bands)
+            shingle_size: Количество слов в шингле
+            seed: Зерно для генерации хэш-функций
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm должно делиться на bands без остатка")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = random.Random(seed)
+        self.__permutations = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+                               for _ in range(num_perm)]
+        self.__buckets: List[Dict[Tuple[int, ...], List[str]]] = [{} for _ in range(bands)]
+        self.__signatures: Dict[str, Tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__signatures)
+
+    def _shingles(self, text: str) -> set:
+        """Разбить текст на хэши словесных шинглов"""
+        words = _WORD_RE.findall(_TAG_RE.sub(" ", text).lower())
+        k = self.shingle_size
+        if len(words) <= k:
+            return {zlib.crc32(" ".join(words).encode('utf-8'))}
+        return {zlib.crc32(" ".join(words[i:i + k]).encode('utf-8')) for i in range(len(words) - k + 1)}
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        """
+        Построить MinHash-подпись текста
+
+        Args:
+            text: Текст вакансии
+
+        Returns:
+            Кортеж из num_perm минимальных хэшей
+        """
+        shingles = self._shingles(text)
+        return tuple(min(((a * shingle + b) % _MERSENNE_PRIME) & _MAX_HASH for shingle in shingles)
+                     for a, b in self.__permutations)
+
+    def similarity(self, first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        """Оценить коэффициент Жаккара по двум подписям"""
+        return sum(1 for x, y in zip(first, second) if x == y) / self.num_perm
+
+    def _bands(self, signature: Tuple[int, ...]):
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, signature[band * rows:(band + 1) * rows]
+
+    def query(self, vacancy: VacancyLike) -> Optional[str]:
+        """
+        Найти уже добавленную вакансию, почти совпадающую с данной
+
+        Args:
+            vacancy: Объект Vacancy или словарь вакансии
+
+        Returns:
+            Ключ (URL) найденного дубликата или None
+        """
+        key, text = _vacancy_fields(vacancy)
+        return self._query_signature(key, self.signature(text))
+
+    def _query_signature(self, key: str, signature: Tuple[int, ...]) -> Optional[str]:
+        checked = set()
+        for band, rows in self._bands(signature):
+            for candidate in self.__buckets[band].get(rows, ()):
+                if candidate == key or candidate in checked:
+                    continue
+                checked.add(candidate)
+                if self.similarity(signature, self.__signatures[candidate]) >= self.threshold:
+                    return candidate
+        return None
+
+    def add(self, vacancy: VacancyLike) -> Optional[str]:
+        """
+        Добавить вакансию в индекс, если она не является дубликатом
+
+        Args:
+            vacancy: Объект Vacancy или словарь вакансии
+
+        Returns:
+            Ключ найденного дубликата (вакансия при этом не добавляется) или None
+        """
+        key, text = _vacancy_fields(vacancy)
+        if key in self.__signatures:
+            return key
+
+        signature = self.signature(text)
+        duplicate = self._query_signature(key, signature)
+        if duplicate is not None:
+            return duplicate
+
+        self.__signatures[key] = signature
+        for band, rows in self._bands(signature):
+            self.__buckets[band].setdefault(rows, []).append(key)
+        return None
+
+    def deduplicate(self, vacancies: Iterable[VacancyLike]) -> List[VacancyLike]:
+        """
+        Отбросить вакансии, почти совпадающие с уже добавленными (этап перед сохранением)
+
+        Args:
+            vacancies: Вакансии для проверки
+
+        Returns:
+            Список вакансий без дубликатов
+        """
+        return [vacancy for vacancy in vacancies if self.add(vacancy) is None]
+
+    def find_duplicates(self, vacancies: Iterable[VacancyLike]) -> List[Tuple[str, str]]:
+        """
+        Найти дубликаты в наборе вакансий (например, во всем файле)
+
+        Args:
+            vacancies: Вакансии для проверки
+
+        Returns:
+            Список пар (URL дубликата, URL оригинала)
+        """
+        duplicates = []
+        for vacancy in vacancies:
+            original = self.add(vacancy)
+            if original is not None:
+                duplicates.append((_vacancy_fields(vacancy)[0], original))
+        return duplicates
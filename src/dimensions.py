@@ -0,0 +1,53 @@
+from typing import Dict, Iterable, List
+
+
+class Dimension:
+    """
+    Таблица словарного кодирования повторяющихся строк
+
+    Каждое уникальное значение (работодатель, валюта) хранится один раз,
+    а объекты ссылаются на него по целочисленному идентификатору.
+    """
+
+    __slots__ = ('name', '_ids', '_values')
+
+    def __init__(self, name: str, values: Iterable[str] = ()):
+        """
+        Инициализация таблицы
+
+        Args:
+            name: Название измерения
+            values: Начальные значения (идентификаторы присваиваются по порядку)
+        """
+        self.name = name
+        self._ids: Dict[str, int] = {}
+        self._values: List[str] = []
+        for value in values:
+            self.encode(value)
+
+    def encode(self, value: str) -> int:
+        """Получить идентификатор значения, добавив его в таблицу при необходимости"""
+        value_id = self._ids.get(value)
+        if value_id is None:
+            value_id = self._ids[value] = len(self._values)
+            self._values.append(value)
+        return value_id
+
+    def decode(self, value_id: int) -> str:
+        """Получить значение по идентификатору"""
+        return self._values[value_id]
+
+    def values(self) -> List[str]:
+        """Получить список значений в порядке идентификаторов"""
+        return list(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, value: str) -> bool:
+        return value in self._ids
+
+
+# Общие таблицы для объектов Vacancy в памяти процесса
+EMPLOYERS = Dimension("employer")
+CURRENCIES = Dimension("currency")
@@ -0,0 +1,116 @@
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """
+    Поиск множества ключевых слов за один проход по тексту (алгоритм Ахо-Корасик)
+
+    Слова компилируются в автомат один раз, после чего каждый текст просматривается
+    один раз независимо от количества слов.
+    """
+
+    def __init__(self, words: Iterable[str], whole_word: bool = False, ignore_case: bool = True):
+        """
+        Компиляция ключевых слов
+
+        Args:
+            words: Ключевые слова
+            whole_word: Засчитывать только совпадения целых слов
+            ignore_case: Не учитывать регистр (как lower() в filter_vacancies)
+        """
+        self.words = list(dict.fromkeys(words))
+        self.whole_word = whole_word
+        self.ignore_case = ignore_case
+
+        # Пустое слово, как и в операторе in, содержится в любом тексте
+        self.__has_empty = "" in self.words and not whole_word
+
+        self.__goto: List[Dict[str, int]] = [{}]
+        self.__fail: List[int] = [0]
+        self.__output: List[Tuple[int, ...]] = [()]
+        self.__lengths: List[int] = []
+
+        for index, word in enumerate(self.words):
+            self.__lengths.append(len(self._normalize(word)))
+            if word:
+                self._insert(self._normalize(word), index)
+        self._build_failure_links()
+
+    def _normalize(self, text: str) -> str:
+        return text.lower() if self.ignore_case else text
+
+    def _insert(self, word: str, index: int):
+        state = 0
+        for char in word:
+            next_state = self.__goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.__goto)
+                self.__goto[state][char] = next_state
+                self.__goto.append({})
+                self.__fail.append(0)
+                self.__output.append(())
+            state = next_state
+        self.__output[state] += (index,)
+
+    def _build_failure_links(self):
+        """Построить суффиксные ссылки обходом в ширину"""
+        queue = list(self.__goto[0].values())
+        goto, fail, output = self.__goto, self.__fail, self.__output
+
+        for state in queue:
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                link = fail[state]
+                while link and char not in goto[link]:
+                    link = fail[link]
+                candidate = goto[link].get(char, 0)
+                fail[next_state] = candidate if candidate != next_state else 0
+                output[next_state] += output[fail[next_state]]
+
+    def _iter_hits(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Перебрать совпадения как пары (индекс слова, позиция конца)"""
+        goto, fail, output, lengths = self.__goto, self.__fail, self.__output, self.__lengths
+        whole_word = self.whole_word
+        text = self._normalize(text)
+        state = 0
+
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for index in output[state]:
+                if whole_word:
+                    start = position - lengths[index] + 1
+                    if start > 0 and _is_word_char(text[start - 1]):
+                        continue
+                    if position + 1 < len(text) and _is_word_char(text[position + 1]):
+                        continue
+                yield index, position + 1
+
+    def matches(self, text: str) -> bool:
+        """Проверить, что в тексте есть хотя бы одно из слов (просмотр останавливается на первом)"""
+        if self.__has_empty:
+            return True
+        for _ in self._iter_hits(text):
+            return True
+        return False
+
+    def find(self, text: str) -> Set[str]:
+        """
+        Найти слова, встречающиеся в тексте
+
+        Args:
+            text: Текст для поиска
+
+        Returns:
+            Множество найденных слов (в исходном написании)
+        """
+        found = {self.words[index] for index, _ in self._iter_hits(text)}
+        if self.__has_empty:
+            found.add("")
+        return found
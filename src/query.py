@@ -0,0 +1,268 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+# Стоимость проверок: чем меньше, тем раньше проверка выполняется
+_COST_NUMERIC = 1
+_COST_EQUALITY = 2
+_COST_TITLE = 3
+_COST_KEYWORD = 4
+
+_MISSING = object()
+
+
+def _always_true(vacancy: Dict[str, Any]) -> bool:
+    return True
+
+
+def _get_field(vacancy: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    """Получить значение поля по пути вида ('salary', 'currency')"""
+    value: Any = vacancy
+    for part in path:
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def _is_operator_dict(value: Any) -> bool:
+    """Проверить, что значение является словарем операторов ({'$gte': ...})"""
+    return isinstance(value, dict) and bool(value) and all(str(key).startswith("$") for key in value)
+
+
+def _check_sequence(operator: str, value: Any):
+    """Проверить, что операнд является списком, кортежем или множеством"""
+    if not isinstance(value, (list, tuple, set, frozenset)):
+        raise ValueError(f"Оператор {operator} ожидает список, получено: {type(value).__name__}")
+
+
+def _check_string(key: str, value: Any):
+    """Проверить, что значение критерия является строкой"""
+    if not isinstance(value, str):
+        raise ValueError(f"Критерий {key} ожидает строку, получено: {type(value).__name__}")
+
+
+def _compile_salary_min(value: Any) -> Tuple[int, Predicate]:
+    threshold = float(value)
+
+    def check(vacancy: Dict[str, Any]) -> bool:
+        return vacancy.get("average_salary", 0) >= threshold
+
+    return _COST_NUMERIC, check
+
+
+def _compile_salary_max(value: Any) -> Tuple[int, Predicate]:
+    threshold = float(value)
+
+    def check(vacancy: Dict[str, Any]) -> bool:
+        return vacancy.get("average_salary", 0) <= threshold
+
+    return _COST_NUMERIC, check
+
+
+def _compile_keyword(value: str) -> Tuple[int, Predicate]:
+    _check_string("keyword", value)
+    needle = value.lower()
+
+    def check(vacancy: Dict[str, Any]) -> bool:
+        text = f"{vacancy.get('title', '')} {vacancy.get('description', '')} {vacancy.get('employer', '')}"
+        return needle in text.lower()
+
+    return _COST_KEYWORD, check
+
+
+def _compile_title(value: str) -> Tuple[int, Predicate]:
+    _check_string("title", value)
+    needle = value.lower()
+
+    def check(vacancy: Dict[str, Any]) -> bool:
+        return needle in vacancy.get("title", "").lower()
+
+    return _COST_TITLE, check
+
+
+def _compile_equality(key: str, value: Any) -> Tuple[int, Predicate]:
+    # Отсутствующее в вакансии поле не участвует в фильтрации
+    def check(vacancy: Dict[str, Any]) -> bool:
+        return key not in vacancy or vacancy[key] == value
+
+    return _COST_EQUALITY, check
+
+
+def _compile_operator(path: Tuple[str, ...], operator: str, value: Any) -> Tuple[int, Predicate]:
+    """Скомпилировать один оператор сравнения для поля"""
+    if operator in ("$gt", "$gte", "$lt", "$lte"):
+        bound = float(value)
+
+        if operator == "$gt":
+            def compare(field: float) -> bool:
+                return field > bound
+        elif operator == "$gte":
+            def compare(field: float) -> bool:
+                return field >= bound
+        elif operator == "$lt":
+            def compare(field: float) -> bool:
+                return field < bound
+        else:
+            def compare(field: float) -> bool:
+                return field <= bound
+
+        def check(vacancy: Dict[str, Any]) -> bool:
+            field = _get_field(vacancy, path)
+            return isinstance(field, (int, float)) and compare(field)
+
+        return _COST_NUMERIC, check
+
+    if operator == "$eq":
+        def check(vacancy: Dict[str, Any]) -> bool:
+            return _get_field(vacancy, path) == value
+
+        return _COST_EQUALITY, check
+
+    if operator == "$ne":
+        def check(vacancy: Dict[str, Any]) -> bool:
+            return _get_field(vacancy, path) != value
+
+        return _COST_EQUALITY, check
+
+    if operator in ("$in", "$nin"):
+        _check_sequence(operator, value)
+        try:
+            options = frozenset(value)
+        except TypeError:
+            options = list(value)
+        expected = operator == "$in"
+
+        def check(vacancy: Dict[str, Any]) -> bool:
+            field = _get_field(vacancy, path)
+            try:
+                return (field in options) == expected
+            except TypeError:
+                return not expected
+
+        return _COST_EQUALITY, check
+
+    if operator == "$contains":
+        needle = str(value).lower()
+
+        def check(vacancy: Dict[str, Any]) -> bool:
+            field = _get_field(vacancy, path)
+            return isinstance(field, str) and needle in field.lower()
+
+        return _COST_TITLE, check
+
+    raise ValueError(f"Неизвестный оператор: {operator}")
+
+
+def _combine_all(checks: List[Tuple[int, Predicate]]) -> Tuple[int, Predicate]:
+    """Объединить проверки через И, начиная с самых дешевых"""
+    if not checks:
+        return 0, _always_true
+
+    checks.sort(key=lambda item: item[0])
+    cost = sum(item[0] for item in checks)
+    predicates = tuple(item[1] for item in checks)
+
+    if len(predicates) == 1:
+        return cost, predicates[0]
+
+    def check(vacancy: Dict[str, Any]) -> bool:
+        for predicate in predicates:
+            if not predicate(vacancy):
+                return False
+        return True
+
+    return cost, check
+
+
+def _combine_any(checks: List[Tuple[int, Predicate]]) -> Tuple[int, Predicate]:
+    """Объединить проверки через ИЛИ, начиная с самых дешевых"""
+    if not checks:
+        return 0, lambda vacancy: False
+
+    checks.sort(key=lambda item: item[0])
+    cost = sum(item[0] for item in checks)
+    predicates = tuple(item[1] for item in checks)
+
+    if len(predicates) == 1:
+        return cost, predicates[0]
+
+    def check(vacancy: Dict[str, Any]) -> bool:
+        for predicate in predicates:
+            if predicate(vacancy):
+                return True
+        return False
+
+    return cost, check
+
+
+def _compile_node(criteria: dict) -> Tuple[int, Predicate]:
+    """Скомпилировать словарь критериев в пару (стоимость, предикат)"""
+    if not isinstance(criteria, dict):
+        raise ValueError(f"Критерии должны быть словарем, получено: {type(criteria).__name__}")
+    checks: List[Tuple[int, Predicate]] = []
+
+    for key, value in criteria.items():
+        if key == "$and":
+            _check_sequence(key, value)
+            checks.append(_combine_all([_compile_node(item) for item in value]))
+
+        elif key == "$or":
+            _check_sequence(key, value)
+            checks.append(_combine_any([_compile_node(item) for item in value]))
+
+        elif key == "$not":
+            cost, inner = _compile_node(value)
+            checks.append((cost, lambda vacancy, inner=inner: not inner(vacancy)))
+
+        elif key == "salary_min":
+            checks.append(_compile_salary_min(value))
+
+        elif key == "salary_max":
+            checks.append(_compile_salary_max(value))
+
+        elif key == "keyword":
+            if value:
+                checks.append(_compile_keyword(value))
+
+        elif key == "title" and not _is_operator_dict(value):
+            if value:
+                checks.append(_compile_title(value))
+
+        elif _is_operator_dict(value):
+            path = tuple(key.split("."))
+            for operator, operand in value.items():
+                checks.append(_compile_operator(path, operator, operand))
+
+        else:
+            checks.append(_compile_equality(key, value))
+
+    return _combine_all(checks)
+
+
+def compile_criteria(criteria: Optional[dict]) -> Predicate:
+    """
+    Скомпилировать критерии поиска в предикат
+
+    Константы нормализуются один раз, а проверки упорядочиваются по стоимости:
+    сначала числовые сравнения, затем равенства и в конце поиск подстрок.
+
+    Поддерживаемые критерии:
+        salary_min, salary_max: Границы средней зарплаты
+        keyword: Подстрока в названии, описании или работодателе
+        title: Подстрока в названии
+        <поле>: {"$gt" | "$gte" | "$lt" | "$lte" | "$eq" | "$ne" | "$in" | "$nin" | "$contains": значение}
+            (вложенные поля указываются через точку, например "salary.currency")
+        $and, $or: Списки вложенных критериев
+        $not: Вложенные критерии
+        <поле>: значение - точное совпадение, если поле есть в вакансии
+
+    Args:
+        criteria: Словарь с критериями поиска
+
+    Returns:
+        Функция, принимающая словарь вакансии и возвращающая True при совпадении
+    """
+    if not criteria:
+        return _always_true
+    return _compile_node(criteria)[1]
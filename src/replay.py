@@ -0,0 +1,291 @@
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from src.abstract_classes import APIHandler
+from src.api import HeadHunterAPI
+
+
+class ResponseArchive:
+    """Архив ответов API HeadHunter: (запрос, регион) -> список вакансий"""
+
+    def __init__(self, filename: Optional[str] = None):
+        """
+        Инициализация архива
+
+        Args:
+            filename: JSON файл архива (если существует - загружается)
+        """
+        self.filename = filename
+        self.__responses: Dict[str, List[Dict[str, Any]]] = {}
+        if filename and os.path.exists(filename):
+            with open(filename, 'r', encoding='utf-8') as file:
+                self.__responses = json.load(file)
+
+    @staticmethod
+    def _key(search_query: str, area: str) -> str:
+        return f"{area}\t{search_query}"
+
+    def add(self, search_query: str, area: str, items: List[Dict[str, Any]]):
+        """Сохранить ответ в архиве"""
+        self.__responses[self._key(search_query, str(area))] = items
+
+    def get(self, search_query: str, area: str) -> List[Dict[str, Any]]:
+        """Получить вакансии из архива (пустой список, если запрос не записан)"""
+        return self.__responses.get(self._key(search_query, str(area)), [])
+
+    def recorded_requests(self) -> List[tuple]:
+        """Получить список записанных пар (поисковый запрос, регион)"""
+        return [tuple(reversed(key.split("\t", 1))) for key in self.__responses]
+
+    def __len__(self) -> int:
+        return len(self.__responses)
+
+    def save(self, filename: Optional[str] = None):
+        """Записать архив в файл"""
+        filename = filename or self.filename
+        with open(filename, 'w', encoding='utf-8') as file:
+            json.dump(self.__responses, file, ensure_ascii=False)
+
+
+class RecordingAPI(APIHandler):
+    """Обертка над API, записывающая все ответы в архив"""
+
+    def __init__(self, archive: ResponseArchive, api: Optional[APIHandler] = None):
+        self.archive = archive
+        self.__api = api or HeadHunterAPI()
+
+    def get_vacancies(self, search_query: str, area: str = "113") -> List[Dict[str, Any]]:
+        """Получить вакансии из API и записать ответ (неудачные запросы не записываются)"""
+        if not isinstance(self.__api, HeadHunterAPI):
+            items = self.__api.get_vacancies(search_query, area)
+        else:
+            try:
+                items = self.__api._fetch_vacancies(search_query, area)
+            except requests.RequestException as e:
+                print(f"Ошибка при получении вакансий: {e}")
+                return []
+        self.archive.add(search_query, area, items)
+        return items
+
+
+class ReplayAPI(APIHandler):
+    """API, воспроизводящее ответы из архива без обращения к сети"""
+
+    def __init__(self, archive: ResponseArchive):
+        self.archive = archive
+
+    def get_vacancies(self, search_query: str, area: str = "113") -> List[Dict[str, Any]]:
+        """Получить вакансии из архива"""
+        return self.archive.get(search_query, area)
+
+
+class StubStats:
+    """Потокобезопасные счетчики ответов заглушки"""
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.counts: Dict[int, int] = {}
+
+    def count(self, status: int):
+        with self.__lock:
+            self.counts[status] = self.counts.get(status, 0) + 1
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Обработчик заглушки: GET /vacancies?text=...&area=...&page=...&per_page=..."""
+
+    archive: ResponseArchive
+    latency: float
+    error_rate: float
+    throttle_rate: float
+    rng: random.Random
+    stats: StubStats
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, payload: Dict[str, Any]):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.stats.count(status)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if status == 429:
+            self.send_header('Retry-After', '1')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path.rstrip("/") != "/vacancies":
+            self._reply(404, {"errors": [{"type": "not_found"}]})
+            return
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        roll = self.rng.random()
+        if roll < self.throttle_rate:
+            self._reply(429, {"errors": [{"type": "too_many_requests"}]})
+            return
+        if roll < self.throttle_rate + self.error_rate:
+            self._reply(500, {"errors": [{"type": "internal_error"}]})
+            return
+
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        items = self.archive.get(query.get('text', ''), query.get('area', '113'))
+        per_page = max(int(query.get('per_page', 20)), 1)
+        page = int(query.get('page', 0))
+        self._reply(200, {
+            "items": items[page * per_page:(page + 1) * per_page],
+            "found": len(items),
+            "pages": (len(items) + per_page - 1) // per_page,
+            "page": page,
+            "per_page": per_page
+        })
+
+
+def create_stub_server(archive: ResponseArchive, host: str = "127.0.0.1", port: int = 0,
+                       latency: float = 0.0, error_rate: float = 0.0, throttle_rate: float = 0.0,
+                       seed: Optional[int] = None) -> ThreadingHTTPServer:
+    """
+    Создать локальную заглушку API HeadHunter, отдающую ответы из архива
+
+    Адрес для HeadHunterAPI: f"http://{host}:{server.server_address[1]}/vacancies".
+    Счетчики ответов по статусам доступны в server.stats.
+
+    Args:
+        archive: Архив ответов
+        host: Адрес для прослушивания
+        port: Порт (0 - выбрать свободный)
+        latency: Задержка каждого ответа в секундах
+        error_rate: Доля ответов с ошибкой 500
+        throttle_rate: Доля ответов 429 Too Many Requests
+        seed: Зерно генератора случайных чисел для воспроизводимости
+
+    Returns:
+        Сервер, готовый к вызову serve_forever()
+    """
+    stats = StubStats()
+    handler = type("StubHandler", (_StubHandler,), {
+        "archive": archive,
+        "latency": latency,
+        "error_rate": error_rate,
+        "throttle_rate": throttle_rate,
+        "rng": random.Random(seed),
+        "stats": stats
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.stats = stats
+    return server
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(q * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def run_load_test(api: APIHandler, requests_list: Sequence[tuple], concurrency: int = 8) -> Dict[str, float]:
+    """
+    Нагрузочный тест клиента API
+
+    Args:
+        api: Клиент API (например, HeadHunterAPI с адресом заглушки)
+        requests_list: Список пар (поисковый запрос, регион)
+        concurrency: Количество одновременных запросов
+
+    Ошибки считаются на стороне клиента: для HeadHunterAPI запрос выполняется без
+    подавления ошибок, для других клиентов ошибкой считается любое исключение.
+    Пропускная способность и задержки считаются только по успешным запросам.
+
+    Returns:
+        Словарь с количеством запросов, количеством ошибок, пропускной способностью
+        (успешных запросов в секунду) и задержками p50/p95/p99/max в секундах
+    """
+    fetch = api._fetch_vacancies if isinstance(api, HeadHunterAPI) else api.get_vacancies
+
+    def timed(request: tuple) -> Tuple[bool, float]:
+        started = time.perf_counter()
+        try:
+            fetch(*request)
+        except Exception:
+            return False, time.perf_counter() - started
+        return True, time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(timed, requests_list))
+    elapsed = time.perf_counter() - started
+    latencies = sorted(latency for ok, latency in results if ok)
+
+    return {
+        "requests": len(results),
+        "failed": len(results) - len(latencies),
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "p50": _percentile(latencies, 0.50),
+        "p95": _percentile(latencies, 0.95),
+        "p99": _percentile(latencies, 0.99),
+        "max": latencies[-1] if latencies else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Заглушка API HeadHunter и нагрузочный тест клиента")
+    parser.add_argument("archive", help="JSON файл архива ответов")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency", type=float, default=0.0, help="Задержка ответа, сек")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Доля ответов 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Доля ответов 429")
+    parser.add_argument("--load", type=int, default=0,
+                        help="Выполнить указанное число запросов и вывести статистику вместо запуска сервера")
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    archive = ResponseArchive(args.archive)
+    server = create_stub_server(archive, port=args.port, latency=args.latency,
+                                error_rate=args.error_rate, throttle_rate=args.throttle_rate)
+    url = f"http://127.0.0.1:{server.server_address[1]}/vacancies"
+
+    if not args.load:
+        print(f"Заглушка API запущена: {url}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    recorded = archive.recorded_requests() or [("", "113")]
+    requests_list = [recorded[i % len(recorded)] for i in range(args.load)]
+
+    result = run_load_test(HeadHunterAPI(url), requests_list, args.concurrency)
+    server.shutdown()
+    server.server_close()
+
+    print(f"Запросов: {result['requests']}, ошибок: {result['failed']}, "
+          f"успешных {result['throughput']:.1f} в секунду")
+    print(f"Задержка p50={result['p50'] * 1000:.1f} мс, p95={result['p95'] * 1000:.1f} мс, "
+          f"p99={result['p99'] * 1000:.1f} мс, max={result['max'] * 1000:.1f} мс")
+    print(f"Ответы по статусам: {server.stats.counts}")
+
+
+if __name__ == "__main__":
+    main()
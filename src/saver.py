@@ -1,38 +1,209 @@
+import gzip
+import heapq
 import json
+import lzma
 import os
-from typing import List, Dict, Any
-from src.abstract_classes import DataSaver
+import time
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from src.abstract_classes import DataSaver, VacancyListener
+from src.dimensions import Dimension
+from src.query import compile_criteria
 from src.vacancy import Vacancy
 
+_READ_CHUNK_SIZE = 64 * 1024
+_DIMENSIONS_KEY = "dimensions"
+
+# Поддерживаемые форматы сжатия: функция открытия файла и сигнатура в начале файла
+_COMPRESSION = {
+    "gzip": (gzip.open, b"\x1f\x8b"),
+    "lzma": (lzma.open, b"\xfd7zXZ\x00"),
+}
+_COMPRESSION_BY_EXTENSION = {".gz": "gzip", ".xz": "lzma"}
+_COMPRESSION_ERRORS = (EOFError, gzip.BadGzipFile, lzma.LZMAError)
+
+
+def salary_cursor(vacancy: Dict[str, Any]) -> Tuple[float, str]:
+    """Получить курсор вакансии для постраничного вывода топа по зарплате"""
+    return vacancy.get('average_salary', 0), vacancy.get('url', '')
+
+
+def salary_order(vacancy: Dict[str, Any]) -> Tuple[float, str]:
+    """Ключ порядка вакансий по зарплате: по убыванию средней зарплаты, затем по URL"""
+    return -vacancy.get('average_salary', 0), vacancy.get('url', '')
+
+
+def paginate(vacancies: Iterable[Dict[str, Any]], limit: Optional[int], offset: int) -> List[Dict[str, Any]]:
+    """Взять страницу из ленивой последовательности, не вычисляя лишних элементов"""
+    stop = None if limit is None else offset + limit
+    return list(islice(vacancies, offset, stop))
+
+
+def record_key(vacancy: Dict[str, Any]) -> str:
+    """Ключ для проверки точного совпадения вакансий (эквивалент сравнения словарей)"""
+    return json.dumps(vacancy, sort_keys=True, ensure_ascii=False)
+
+
+def _encode_records(vacancies: List[Dict[str, Any]]) -> List[Any]:
+    """
+    Закодировать вакансии в компактный формат
+
+    Первый элемент - заголовок с таблицами работодателей и валют, остальные -
+    строки [title, url, from, to, currency_id, description, employer_id, average_salary].
+    """
+    employers = Dimension("employer")
+    currencies = Dimension("currency")
+    rows: List[Any] = []
+
+    for vacancy in vacancies:
+        salary = vacancy.get('salary', {})
+        rows.append([
+            vacancy.get('title', ''),
+            vacancy.get('url', ''),
+            salary.get('from', 0),
+            salary.get('to', 0),
+            currencies.encode(salary.get('currency', '')),
+            vacancy.get('description', ''),
+            employers.encode(vacancy.get('employer', '')),
+            vacancy.get('average_salary', 0.0)
+        ])
+
+    header = {_DIMENSIONS_KEY: {"employer": employers.values(), "currency": currencies.values()}}
+    return [header] + rows
+
+
+def _decode_records(items: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+    """Раскодировать записи файла в словари вакансий (обычный формат возвращается как есть)"""
+    items = iter(items)
+    first = next(items, None)
+    if first is None:
+        return
+
+    if not (isinstance(first, dict) and _DIMENSIONS_KEY in first):
+        yield first
+        yield from items
+        return
+
+    employers = first[_DIMENSIONS_KEY]["employer"]
+    currencies = first[_DIMENSIONS_KEY]["currency"]
+    for title, url, salary_from, salary_to, currency_id, description, employer_id, average_salary in items:
+        yield {
+            "title": title,
+            "url": url,
+            "salary": {"from": salary_from, "to": salary_to, "currency": currencies[currency_id]},
+            "description": description,
+            "employer": employers[employer_id],
+            "average_salary": average_salary
+        }
+
+
+def _iter_json_array(file: TextIO) -> Iterator[Dict[str, Any]]:
+    """
+    Потоково разобрать JSON массив из файла
+
+    Элементы разбираются по одному по мере чтения файла блоками. Разбор
+    прекращается на первом некорректном фрагменте.
+    """
+    decoder = json.JSONDecoder()
+    buffer = file.read(_READ_CHUNK_SIZE).lstrip()
+    if not buffer.startswith('['):
+        return
+    pos = 1
+    eof = False
+
+    while True:
+        # Пропускаем пробелы и разделители, при необходимости дочитывая файл
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos < len(buffer) or eof:
+                break
+            buffer, pos = file.read(_READ_CHUNK_SIZE), 0
+            eof = not buffer
+
+        if pos >= len(buffer) or buffer[pos] == ']':
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                return
+            chunk = file.read(_READ_CHUNK_SIZE)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+
+        yield item
+        pos = end
+
 
 class JSONSaver(DataSaver):
     """Класс для сохранения вакансий в JSON файл"""
 
-    def get_vacancies_by_salary_range(self, min_salary: float = 0, max_salary: float = float('inf')) -> List[
-        Dict[str, Any]]:
+    def get_vacancies_by_salary_range(self, min_salary: float = 0, max_salary: float = float('inf'),
+                                      limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
         """
         Получить вакансии по диапазону зарплат
 
         Args:
             min_salary: Минимальная зарплата
             max_salary: Максимальная зарплата
+            limit: Максимальное количество вакансий (None - без ограничения)
+            offset: Количество пропускаемых вакансий
 
         Returns:
-            Отфильтрованный список вакансий
+            Список вакансий, отсортированный по убыванию средней зарплаты
         """
-        vacancies = self._load_vacancies()
-        filtered = []
+        filtered = (vacancy for vacancy in self.iter_vacancies()
+                    if min_salary <= vacancy.get('average_salary', 0) <= max_salary)
+        if limit is None:
+            return sorted(filtered, key=salary_order)[offset:]
+        return heapq.nsmallest(offset + limit, filtered, key=salary_order)[offset:]
+
+    def __init__(self, filename: str = "data/vacancies.json", encoded: bool = False,
+                 compression: Optional[str] = None, compression_level: Optional[int] = None):
+        """
+        Инициализация хранилища
 
-        for vacancy in vacancies:
-            avg_salary = vacancy.get('average_salary', 0)
-            if min_salary <= avg_salary <= max_salary:
-                filtered.append(vacancy)
+        Args:
+            filename: Путь к файлу с вакансиями
+            encoded: Сохранять файл в компактном формате со словарным кодированием
+                работодателей и валют (читаются оба формата)
+            compression: Сжатие при записи: "gzip", "lzma" или None (по умолчанию
+                определяется по расширению .gz/.xz). При чтении формат определяется
+                по содержимому файла
+            compression_level: Уровень сжатия (gzip: 1-9, lzma: 0-9)
+        """
+        if compression is None:
+            compression = _COMPRESSION_BY_EXTENSION.get(os.path.splitext(filename)[1])
+        if compression is not None and compression not in _COMPRESSION:
+            raise ValueError(f"Неизвестный формат сжатия: {compression}")
 
-        return filtered
-    def __init__(self, filename: str = "data/vacancies.json"):
         self.filename = filename
+        self.encoded = encoded
+        self.compression = compression
+        self.compression_level = compression_level
+        self._listeners: List[VacancyListener] = []
         self._ensure_directory_exists()
 
+    def add_listener(self, listener: VacancyListener):
+        """Подписать обработчик на добавление и удаление вакансий"""
+        self._listeners.append(listener)
+
+    def buffered(self, max_pending: int = 1000, max_delay: Optional[float] = 1.0) -> "BufferedWriter":
+        """
+        Получить буферизованный писатель для поштучных add_vacancy/delete_vacancy
+
+        Args:
+            max_pending: Количество операций в очереди, при котором выполняется запись
+            max_delay: Максимальный возраст операции в очереди в секундах (None - без ограничения)
+
+        Returns:
+            Объект BufferedWriter (можно использовать в with)
+        """
+        return BufferedWriter(self, max_pending, max_delay)
+
     def _ensure_directory_exists(self):
         """Создать директорию, если она не существует"""
         directory = os.path.dirname(self.filename)
@@ -48,6 +219,8 @@ class JSONSaver(DataSaver):
         if vacancy_dict not in vacancies:
             vacancies.append(vacancy_dict)
             self._save_vacancies(vacancies)
+            for listener in self._listeners:
+                listener.on_add([vacancy_dict])
             print(f"Вакансия '{vacancy.title}' добавлена.")
         else:
             print(f"Вакансия '{vacancy.title}' уже существует в файле.")
@@ -65,56 +238,54 @@ class JSONSaver(DataSaver):
         if new_vacancies:
             existing_vacancies.extend(new_vacancies)
             self._save_vacancies(existing_vacancies)
+            for listener in self._listeners:
+                listener.on_add(new_vacancies)
             print(f"Добавлено {len(new_vacancies)} вакансий.")
         else:
             print("Нет новых вакансий для добавления.")
 
-    def get_vacancies(self, criteria: dict = None) -> List[Dict[str, Any]]:
+    def get_vacancies(self, criteria: dict = None, limit: Optional[int] = None,
+                      offset: int = 0) -> List[Dict[str, Any]]:
         """
         Получить вакансии по критериям
 
+        Если задан limit, файл читается потоково и чтение прекращается,
+        как только страница заполнена.
+
         Args:
-            criteria: Словарь с критериями поиска
+            criteria: Словарь с критериями поиска (см. src.query.compile_criteria)
+            limit: Максимальное количество вакансий (None - без ограничения)
+            offset: Количество пропускаемых вакансий
 
         Returns:
             Список вакансий, удовлетворяющих критериям
         """
-        vacancies = self._load_vacancies()
-
-        if not criteria:
-            return vacancies
-
-        filtered_vacancies = []
-        for vacancy in vacancies:
-            match = True
+        if limit is None and not offset:
+            vacancies = self._load_vacancies()
 
-            for key, value in criteria.items():
-                if key == "salary_min":
-                    avg_salary = vacancy.get("average_salary", 0)
-                    if avg_salary < float(value):
-                        match = False
-                        break
+            if not criteria:
+                return vacancies
 
-                elif key == "keyword" and value:
-                    vacancy_text = f"{vacancy.get('title', '')} {vacancy.get('description', '')} {vacancy.get('employer', '')}".lower()
-                    if value.lower() not in vacancy_text:
-                        match = False
-                        break
+            predicate = compile_criteria(criteria)
+            return [vacancy for vacancy in vacancies if predicate(vacancy)]
 
-                elif key == "title" and value:
-                    title = vacancy.get('title', '').lower()
-                    if value.lower() not in title:
-                        match = False
-                        break
+        return paginate(self.iter_vacancies(criteria), limit, offset)
 
-                elif key in vacancy and vacancy[key] != value:
-                    match = False
-                    break
+    def iter_vacancies(self, criteria: dict = None) -> Iterator[Dict[str, Any]]:
+        """
+        Лениво перебрать вакансии по критериям, читая файл по частям
 
-            if match:
-                filtered_vacancies.append(vacancy)
+        Args:
+            criteria: Словарь с критериями поиска (см. src.query.compile_criteria)
 
-        return filtered_vacancies
+        Yields:
+            Вакансии, удовлетворяющие критериям
+        """
+        vacancies = self._iter_file_vacancies()
+        if not criteria:
+            return vacancies
+        predicate = compile_criteria(criteria)
+        return (vacancy for vacancy in vacancies if predicate(vacancy))
 
     def delete_vacancy(self, vacancy: Vacancy):
         """Удалить вакансию из файла"""
@@ -124,6 +295,8 @@ class JSONSaver(DataSaver):
         if vacancy_dict in vacancies:
             vacancies.remove(vacancy_dict)
             self._save_vacancies(vacancies)
+            for listener in self._listeners:
+                listener.on_delete(vacancy_dict)
             print(f"Вакансия '{vacancy.title}' удалена.")
         else:
             print(f"Вакансия '{vacancy.title}' не найдена в файле.")
@@ -131,38 +304,194 @@ class JSONSaver(DataSaver):
     def clear_file(self):
         """Очистить файл с вакансиями"""
         self._save_vacancies([])
+        for listener in self._listeners:
+            listener.on_clear()
         print("Файл с вакансиями очищен.")
 
+    def _open_for_read(self) -> TextIO:
+        """Открыть файл на чтение, распаковывая его на лету, если он сжат"""
+        with open(self.filename, 'rb') as file:
+            signature = file.read(6)
+        for opener, magic in _COMPRESSION.values():
+            if signature.startswith(magic):
+                return opener(self.filename, 'rt', encoding='utf-8')
+        return open(self.filename, 'r', encoding='utf-8')
+
+    def _open_for_write(self) -> TextIO:
+        """Открыть файл на запись с учетом выбранного сжатия"""
+        if self.compression is None:
+            return open(self.filename, 'w', encoding='utf-8')
+
+        opener = _COMPRESSION[self.compression][0]
+        if self.compression_level is None:
+            return opener(self.filename, 'wt', encoding='utf-8')
+        if self.compression == "lzma":
+            return opener(self.filename, 'wt', encoding='utf-8', preset=self.compression_level)
+        return opener(self.filename, 'wt', encoding='utf-8', compresslevel=self.compression_level)
+
     def _load_vacancies(self) -> List[Dict[str, Any]]:
         """Загрузить вакансии из файла"""
         try:
             if os.path.exists(self.filename):
-                with open(self.filename, 'r', encoding='utf-8') as file:
-                    return json.load(file)
+                with self._open_for_read() as file:
+                    return list(_decode_records(json.load(file)))
             return []
-        except (json.JSONDecodeError, FileNotFoundError):
+        except (json.JSONDecodeError, FileNotFoundError) + _COMPRESSION_ERRORS:
             return []
 
+    def _iter_file_vacancies(self) -> Iterator[Dict[str, Any]]:
+        """Потоково прочитать массив вакансий из файла, не загружая его целиком"""
+        if not os.path.exists(self.filename):
+            return
+        try:
+            with self._open_for_read() as file:
+                yield from _decode_records(_iter_json_array(file))
+        except _COMPRESSION_ERRORS:
+            return
+
     def _save_vacancies(self, vacancies: List[Dict[str, Any]]):
         """Сохранить вакансии в файл"""
-        with open(self.filename, 'w', encoding='utf-8') as file:
-            json.dump(vacancies, file, ensure_ascii=False, indent=2)
-
-    def get_top_vacancies_by_salary(self, n: int) -> List[Dict[str, Any]]:
+        if self.encoded:
+            data = _encode_records(vacancies)
+            with self._open_for_write() as file:
+                json.dump(data, file, ensure_ascii=False, separators=(',', ':'))
+            return
+
+        with self._open_for_write() as file:
+            if self.compression is None:
+                json.dump(vacancies, file, ensure_ascii=False, indent=2)
+            else:
+                # Отступы в сжатом файле только увеличивают объем работы архиватора
+                json.dump(vacancies, file, ensure_ascii=False, separators=(',', ':'))
+
+    def get_top_vacancies_by_salary(self, n: int, after: Optional[Tuple[float, str]] = None) -> List[Dict[str, Any]]:
         """
         Получить топ N вакансий по зарплате
 
+        Вакансии упорядочены по убыванию средней зарплаты, а при равной зарплате - по URL.
+        Для получения следующей страницы передайте в after курсор последней
+        вакансии предыдущей страницы (см. salary_cursor).
+
         Args:
             n: Количество вакансий для возврата
+            after: Курсор (средняя зарплата, URL), после которого начинается страница
 
         Returns:
             Список топ N вакансий
         """
-        vacancies = self._load_vacancies()
         # Фильтруем вакансии с ненулевой зарплатой
-        vacancies_with_salary = [v for v in vacancies if v.get('average_salary', 0) > 0]
-        sorted_vacancies = sorted(vacancies_with_salary, key=lambda x: x.get('average_salary', 0), reverse=True)
-        return sorted_vacancies[:n]
+        vacancies_with_salary = (v for v in self.iter_vacancies() if v.get('average_salary', 0) > 0)
+        if after is not None:
+            after_key = (-after[0], after[1])
+            vacancies_with_salary = (v for v in vacancies_with_salary if salary_order(v) > after_key)
+        return heapq.nsmallest(n, vacancies_with_salary, key=salary_order)
+
+
+class BufferedWriter:
+    """
+    Буферизованная запись в JSONSaver с групповой фиксацией
+
+    Операции add_vacancy, add_vacancies и delete_vacancy ставятся в очередь и
+    применяются одной перезаписью файла при вызове flush(), при выходе из блока with,
+    при накоплении max_pending операций или когда самая старая операция в очереди
+    старше max_delay секунд. Возраст очереди проверяется при очередном вызове,
+    фонового потока нет.
+
+    Гарантии сохранности: до фиксации операции находятся только в памяти и
+    теряются при аварийном завершении процесса. Если запись файла завершилась
+    ошибкой, flush() пробрасывает исключение, а операции остаются в очереди. Операции применяются в порядке
+    поступления с той же семантикой, что у JSONSaver (точное совпадение словарей),
+    а подписчики уведомляются после записи файла. Выход из блока with фиксирует
+    очередь и при исключении.
+    """
+
+    def __init__(self, saver: JSONSaver, max_pending: int = 1000, max_delay: Optional[float] = 1.0):
+        self.__saver = saver
+        self.max_pending = max_pending
+        self.max_delay = max_delay
+        self.__pending: List[Tuple[str, Dict[str, Any]]] = []
+        self.__oldest: Optional[float] = None
+
+    def __enter__(self) -> "BufferedWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
+    def __len__(self) -> int:
+        return len(self.__pending)
+
+    def _enqueue(self, operation: str, vacancy: Vacancy):
+        if not self.__pending:
+            self.__oldest = time.monotonic()
+        self.__pending.append((operation, vacancy.to_dict()))
+        if len(self.__pending) >= self.max_pending or (
+                self.max_delay is not None and time.monotonic() - self.__oldest >= self.max_delay):
+            self.flush()
+
+    def add_vacancy(self, vacancy: Vacancy):
+        """Поставить добавление вакансии в очередь"""
+        self._enqueue("add", vacancy)
+
+    def add_vacancies(self, vacancies: List[Vacancy]):
+        """Поставить добавление нескольких вакансий в очередь"""
+        for vacancy in vacancies:
+            self._enqueue("add", vacancy)
+
+    def delete_vacancy(self, vacancy: Vacancy):
+        """Поставить удаление вакансии в очередь"""
+        self._enqueue("delete", vacancy)
+
+    def flush(self) -> Tuple[int, int]:
+        """
+        Применить накопленные операции одной записью файла
+
+        Returns:
+            Количество добавленных и удаленных вакансий
+        """
+        if not self.__pending:
+            return 0, 0
+        pending, self.__pending = self.__pending, []
+
+        saver = self.__saver
+        try:
+            vacancies = saver._load_vacancies()
+            counts: Dict[str, int] = {}
+            for vacancy in vacancies:
+                key = record_key(vacancy)
+                counts[key] = counts.get(key, 0) + 1
+
+            # Вакансия, добавленная и удаленная в одной фиксации, в файл не попадает
+            # и подписчикам не передается
+            added: Dict[str, Dict[str, Any]] = {}
+            deleted: List[Dict[str, Any]] = []
+            for operation, vacancy_dict in pending:
+                key = record_key(vacancy_dict)
+                if operation == "add":
+                    if not counts.get(key):
+                        counts[key] = 1
+                        vacancies.append(vacancy_dict)
+                        added[key] = vacancy_dict
+                elif counts.get(key):
+                    counts[key] -= 1
+                    vacancies.remove(vacancy_dict)
+                    if added.pop(key, None) is None:
+                        deleted.append(vacancy_dict)
+
+            if added or deleted:
+                saver._save_vacancies(vacancies)
+        except BaseException:
+            # Запись не удалась: операции возвращаются в начало очереди
+            self.__pending = pending + self.__pending
+            raise
+
+        for listener in saver._listeners:
+            if added:
+                listener.on_add(list(added.values()))
+            for vacancy_dict in deleted:
+                listener.on_delete(vacancy_dict)
+        print(f"Записано операций: {len(pending)} (добавлено {len(added)}, удалено {len(deleted)}).")
+        return len(added), len(deleted)
 
 
 class CSVSaver(DataSaver):
@@ -171,7 +500,12 @@ class CSVSaver(DataSaver):
     def add_vacancy(self, vacancy):
         print("CSV сохранение не реализовано")
 
-    def get_vacancies(self, criteria: dict = None):
+    def get_vacancies(self, criteria: dict = None, limit: int = None, offset: int = 0):
+        print("CSV чтение не реализовано")
+        return []
+
+    def get_vacancies_by_salary_range(self, min_salary: float = 0, max_salary: float = float('inf'),
+                                      limit: int = None, offset: int = 0):
         print("CSV чтение не реализовано")
         return []
 
@@ -188,7 +522,12 @@ class TXTSaver(DataSaver):
     def add_vacancy(self, vacancy):
         print("TXT сохранение не реализовано")
 
-    def get_vacancies(self, criteria: dict = None):
+    def get_vacancies(self, criteria: dict = None, limit: int = None, offset: int = 0):
+        print("TXT чтение не реализовано")
+        return []
+
+    def get_vacancies_by_salary_range(self, min_salary: float = 0, max_salary: float = float('inf'),
+                                      limit: int = None, offset: int = 0):
         print("TXT чтение не реализовано")
         return []
 
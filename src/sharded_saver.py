@@ -0,0 +1,233 @@
+import heapq
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.abstract_classes import DataSaver
+from src.saver import JSONSaver, paginate, salary_order
+from src.vacancy import Vacancy
+
+SHARD_SUFFIX = ".json"
+
+
+def _query_shard(filename: str, criteria: Optional[dict]) -> List[Dict[str, Any]]:
+    """Выполнить get_vacancies на одном шарде (запускается в дочернем процессе)"""
+    return JSONSaver(filename).get_vacancies(criteria)
+
+
+def _salary_range_shard(filename: str, min_salary: float, max_salary: float) -> List[Dict[str, Any]]:
+    """Выполнить выборку по диапазону зарплат на одном шарде (результат отсортирован по убыванию)"""
+    return JSONSaver(filename).get_vacancies_by_salary_range(min_salary, max_salary)
+
+
+def _top_shard(filename: str, n: int, after: Optional[Tuple[float, str]]) -> List[Dict[str, Any]]:
+    """Получить топ N вакансий одного шарда"""
+    return JSONSaver(filename).get_top_vacancies_by_salary(n, after)
+
+
+def hash_partition(num_shards: int) -> Callable[[Dict[str, Any]], str]:
+    """
+    Создать функцию разбиения по хэшу URL вакансии
+
+    Args:
+        num_shards: Количество шардов
+
+    Returns:
+        Функция, возвращающая имя шарда для словаря вакансии
+    """
+    if num_shards < 1:
+        raise ValueError("Количество шардов должно быть положительным")
+    width = len(str(num_shards - 1))
+
+    def partition(vacancy: Dict[str, Any]) -> str:
+        # crc32 стабилен между запусками, в отличие от встроенного hash()
+        shard = zlib.crc32(vacancy.get('url', '').encode('utf-8')) % num_shards
+        return f"shard_{shard:0{width}d}"
+
+    return partition
+
+
+class ShardedJSONSaver(DataSaver):
+    """
+    Класс для хранения вакансий в нескольких JSON файлах (шардах)
+
+    Каждый шард - отдельный файл в каталоге, который обслуживается JSONSaver.
+    Запросы выполняются по всем шардам параллельно в пуле процессов,
+    частичные результаты объединяются. Пул создается при первом запросе и
+    используется до вызова close() (или выхода из блока with).
+    """
+
+    def __init__(self, directory: str = "data/shards",
+                 partition: Optional[Callable[[Dict[str, Any]], str]] = None,
+                 num_shards: int = 8, max_workers: Optional[int] = None):
+        """
+        Инициализация хранилища
+
+        Args:
+            directory: Каталог с файлами шардов
+            partition: Функция, возвращающая имя шарда для словаря вакансии
+                (по умолчанию - хэш URL по num_shards шардам)
+            num_shards: Количество шардов для разбиения по хэшу
+            max_workers: Размер пула процессов (1 - выполнять запросы в текущем процессе)
+        """
+        self.directory = directory
+        self.partition = partition or hash_partition(num_shards)
+        self.max_workers = max_workers
+        self.__executor: Optional[ProcessPoolExecutor] = None
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __enter__(self) -> "ShardedJSONSaver":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Завершить пул процессов (при следующем запросе он будет создан заново)"""
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def _shard_path(self, shard: str) -> str:
+        """Получить путь к файлу шарда, проверив, что имя не выходит за пределы каталога"""
+        if not shard or shard in (".", "..") or "/" in shard or "\\" in shard or "\0" in shard:
+            raise ValueError(f"Некорректное имя шарда: {shard!r}")
+        return os.path.join(self.directory, f"{shard}{SHARD_SUFFIX}")
+
+    def shards(self) -> List[str]:
+        """Получить отсортированный список имен существующих шардов"""
+        return sorted(name[:-len(SHARD_SUFFIX)] for name in os.listdir(self.directory)
+                      if name.endswith(SHARD_SUFFIX))
+
+    def _shard_files(self) -> List[str]:
+        return [self._shard_path(shard) for shard in self.shards()]
+
+    def _group_by_shard(self, vacancies: Iterable[Vacancy]) -> Dict[str, List[Dict[str, Any]]]:
+        """Разложить вакансии по шардам"""
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for vacancy in vacancies:
+            vacancy_dict = vacancy.to_dict()
+            groups.setdefault(self.partition(vacancy_dict), []).append(vacancy_dict)
+        return groups
+
+    def _scatter(self, func: Callable, *args) -> List[List[Dict[str, Any]]]:
+        """Выполнить функцию на всех шардах и вернуть частичные результаты в порядке шардов"""
+        files = self._shard_files()
+        if not files:
+            return []
+
+        if self.max_workers == 1 or len(files) == 1:
+            return [func(filename, *args) for filename in files]
+
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(max_workers=self.max_workers or os.cpu_count() or 1)
+        return list(self.__executor.map(func, files, *[[arg] * len(files) for arg in args]))
+
+    def add_vacancy(self, vacancy: Vacancy):
+        """Добавить вакансию в соответствующий шард"""
+        vacancy_dict = vacancy.to_dict()
+        JSONSaver(self._shard_path(self.partition(vacancy_dict))).add_vacancy(vacancy)
+
+    def add_vacancies(self, vacancies: List[Vacancy]):
+        """Добавить несколько вакансий, записывая каждый затронутый шард один раз"""
+        added = 0
+        for shard, shard_vacancies in self._group_by_shard(vacancies).items():
+            saver = JSONSaver(self._shard_path(shard))
+            existing_vacancies = saver._load_vacancies()
+            new_vacancies = [v for v in shard_vacancies if v not in existing_vacancies]
+            if new_vacancies:
+                existing_vacancies.extend(new_vacancies)
+                saver._save_vacancies(existing_vacancies)
+                added += len(new_vacancies)
+
+        if added:
+            print(f"Добавлено {added} вакансий.")
+        else:
+            print("Нет новых вакансий для добавления.")
+
+    def get_vacancies(self, criteria: dict = None, limit: Optional[int] = None,
+                      offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Получить вакансии по критериям со всех шардов
+
+        Если задан limit, шарды читаются последовательно и потоково до заполнения страницы.
+
+        Args:
+            criteria: Словарь с критериями поиска (см. src.query.compile_criteria)
+            limit: Максимальное количество вакансий (None - без ограничения)
+            offset: Количество пропускаемых вакансий
+
+        Returns:
+            Список вакансий, удовлетворяющих критериям
+        """
+        if limit is not None or offset:
+            return paginate(self.iter_vacancies(criteria), limit, offset)
+
+        result = []
+        for part in self._scatter(_query_shard, criteria):
+            result.extend(part)
+        return result
+
+    def iter_vacancies(self, criteria: dict = None) -> Iterator[Dict[str, Any]]:
+        """Лениво перебрать вакансии всех шардов по очереди"""
+        return chain.from_iterable(JSONSaver(filename).iter_vacancies(criteria)
+                                   for filename in self._shard_files())
+
+    def get_vacancies_by_salary_range(self, min_salary: float = 0, max_salary: float = float('inf'),
+                                      limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Получить вакансии по диапазону зарплат со всех шардов
+
+        Args:
+            min_salary: Минимальная зарплата
+            max_salary: Максимальная зарплата
+            limit: Максимальное количество вакансий (None - без ограничения)
+            offset: Количество пропускаемых вакансий
+
+        Returns:
+            Список вакансий, отсортированный по убыванию средней зарплаты
+        """
+        parts = self._scatter(_salary_range_shard, min_salary, max_salary)
+        return paginate(heapq.merge(*parts, key=salary_order), limit, offset)
+
+    def get_top_vacancies_by_salary(self, n: int, after: Optional[Tuple[float, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Получить топ N вакансий по зарплате со всех шардов
+
+        Args:
+            n: Количество вакансий для возврата
+            after: Курсор (средняя зарплата, URL), после которого начинается страница
+
+        Returns:
+            Список топ N вакансий
+        """
+        if n <= 0:
+            return []
+        parts = self._scatter(_top_shard, n, after)
+        return list(islice(heapq.merge(*parts, key=salary_order), n))
+
+    def delete_vacancy(self, vacancy: Vacancy):
+        """Удалить вакансию из соответствующего шарда"""
+        vacancy_dict = vacancy.to_dict()
+        path = self._shard_path(self.partition(vacancy_dict))
+        if os.path.exists(path):
+            JSONSaver(path).delete_vacancy(vacancy)
+        else:
+            print(f"Вакансия '{vacancy.title}' не найдена в файле.")
+
+    def drop_shard(self, shard: str):
+        """Удалить шард целиком (например, устаревший месяц)"""
+        path = self._shard_path(shard)
+        if os.path.exists(path):
+            os.remove(path)
+            print(f"Шард '{shard}' удален.")
+        else:
+            print(f"Шард '{shard}' не найден.")
+
+    def clear_file(self):
+        """Удалить все шарды"""
+        for path in self._shard_files():
+            os.remove(path)
+        print("Файлы с вакансиями очищены.")
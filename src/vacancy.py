@@ -1,7 +1,14 @@
+from types import MappingProxyType
+
+from src.dimensions import CURRENCIES, EMPLOYERS
+
+
 class Vacancy:
     """Класс для представления вакансии"""
 
-    __slots__ = ('title', 'url', 'salary', 'description', 'employer')  # Экономия памяти
+    # Экономия памяти: работодатель и валюта хранятся как идентификаторы
+    # в общих таблицах src.dimensions, зарплата - отдельными полями вместо словаря
+    __slots__ = ('title', 'url', '_salary_from', '_salary_to', '_currency_id', 'description', '_employer_id')
 
     def __init__(self, title: str, url: str, salary: dict, description: str, employer: str = ""):
         """
@@ -16,11 +23,54 @@ class Vacancy:
         """
         self.title = title
         self.url = url
-        self.salary = self._validate_salary(salary)
+        self.salary = salary
         self.description = description
         self.employer = employer
         self._validate_data()
 
+    @property
+    def salary(self) -> MappingProxyType:
+        """
+        Зарплата в формате словаря (только для чтения)
+
+        Значения хранятся в отдельных полях, поэтому изменение элементов словаря
+        невозможно; чтобы изменить зарплату, присвойте атрибуту salary новый словарь.
+        """
+        return MappingProxyType(self._salary_dict())
+
+    def _salary_dict(self) -> dict:
+        """Зарплата в виде обычного словаря"""
+        return {
+            "from": self._salary_from,
+            "to": self._salary_to,
+            "currency": CURRENCIES.decode(self._currency_id)
+        }
+
+    @salary.setter
+    def salary(self, salary_data: dict):
+        validated_salary = self._validate_salary(salary_data)
+        self._salary_from = validated_salary["from"]
+        self._salary_to = validated_salary["to"]
+        self._currency_id = CURRENCIES.encode(validated_salary["currency"])
+
+    @property
+    def employer(self) -> str:
+        """Работодатель"""
+        return EMPLOYERS.decode(self._employer_id)
+
+    @employer.setter
+    def employer(self, employer: str):
+        self._employer_id = EMPLOYERS.encode(employer)
+
+    def __reduce__(self):
+        """
+        Сериализация для pickle
+
+        Идентификаторы действительны только в таблицах текущего процесса, поэтому
+        сохраняются строковые значения, которые заново кодируются при загрузке.
+        """
+        return self.__class__, (self.title, self.url, self._salary_dict(), self.description, self.employer)
+
     def _validate_salary(self, salary_data: dict) -> dict:
         """Валидация данных о зарплате"""
         if not salary_data:
@@ -47,13 +97,14 @@ class Vacancy:
 
     def __str__(self) -> str:
         """Строковое представление вакансии"""
-        salary_from = self.salary['from'] if self.salary['from'] else 0
-        salary_to = self.salary['to'] if self.salary['to'] else 0
+        salary = self._salary_dict()
+        salary_from = salary['from'] if salary['from'] else 0
+        salary_to = salary['to'] if salary['to'] else 0
 
-        if self.salary['currency'] == "Зарплата не указана":
+        if salary['currency'] == "Зарплата не указана":
             salary_str = "Зарплата не указана"
         else:
-            salary_str = f"{salary_from}-{salary_to} {self.salary['currency']}"
+            salary_str = f"{salary_from}-{salary_to} {salary['currency']}"
 
         return (f"{self.title}\n"
                 f"Работодатель: {self.employer}\n"
@@ -63,7 +114,7 @@ class Vacancy:
                 f"{'-' * 50}")
 
     def __repr__(self) -> str:
-        return f"Vacancy('{self.title}', '{self.url}', {self.salary})"
+        return f"Vacancy('{self.title}', '{self.url}', {self._salary_dict()})"
 
     def __eq__(self, other) -> bool:
         """Проверка на равенство по средней зарплате"""
@@ -97,15 +148,18 @@ class Vacancy:
 
     def get_average_salary(self) -> float:
         """Получить среднюю зарплату"""
-        if self.salary["from"] == 0 and self.salary["to"] == 0:
+        salary_from = self._salary_from
+        salary_to = self._salary_to
+
+        if salary_from == 0 and salary_to == 0:
             return 0.0
 
-        if self.salary["from"] and self.salary["to"]:
-            return (float(self.salary["from"]) + float(self.salary["to"])) / 2
-        elif self.salary["from"]:
-            return float(self.salary["from"])
-        elif self.salary["to"]:
-            return float(self.salary["to"])
+        if salary_from and salary_to:
+            return (float(salary_from) + float(salary_to)) / 2
+        elif salary_from:
+            return float(salary_from)
+        elif salary_to:
+            return float(salary_to)
         else:
             return 0.0
 
@@ -162,7 +216,7 @@ class Vacancy:
         return {
             "title": self.title,
             "url": self.url,
-            "salary": self.salary,
+            "salary": self._salary_dict(),
             "description": self.description,
             "employer": self.employer,
             "average_salary": float(self.get_average_salary())
@@ -0,0 +1,74 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.vacancy import Vacancy
+from src.saver import JSONSaver
+from src.alerts import SearchPercolator
+from src.utils import filter_vacancies
+
+
+class TestSearchPercolator(unittest.TestCase):
+
+    def setUp(self):
+        """Создание тестовых вакансий и поисков"""
+        self.python = Vacancy("Python Developer", "https://hh.ru/vacancy/1",
+                              {"from": 100000, "to": 150000, "currency": "RUR"}, "Django, PostgreSQL", "Company A")
+        self.java = Vacancy("Java Developer", "https://hh.ru/vacancy/2",
+                            {"from": 200000, "to": 200000, "currency": "RUR"}, "Spring", "Company B")
+        self.go = Vacancy("Go Developer", "https://hh.ru/vacancy/3", {}, "Микросервисы", "Company C")
+
+        self.percolator = SearchPercolator()
+        self.percolator.add_search("python", ["Python", "django"])
+        self.percolator.add_search("rich", min_salary=180000)
+        self.percolator.add_search("mid", max_salary=150000, min_salary=100000)
+        self.percolator.add_search("backend", ["java", "go"], min_salary=150000)
+        self.percolator.add_search("dev", ["DEVELOPER"])
+
+    def test_match(self):
+        """Тест сопоставления вакансий с поисками"""
+        self.assertEqual(sorted(self.percolator.match(self.python)), ["dev", "mid", "python"])
+        self.assertEqual(sorted(self.percolator.match(self.java)), ["backend", "dev", "rich"])
+        # Короткое слово "go" совпадает, но зарплата не указана
+        self.assertEqual(sorted(self.percolator.match(self.go.to_dict())), ["dev"])
+
+    def test_same_result_as_filter_vacancies(self):
+        """Тест совпадения семантики ключевых слов с filter_vacancies"""
+        vacancies = [self.python, self.java, self.go]
+        for words in (["python"], ["spring", "микро"], ["er"], ["company b"]):
+            percolator = SearchPercolator()
+            percolator.add_search("s", words)
+            expected = [v.url for v in filter_vacancies(vacancies, words)]
+            self.assertEqual([v.url for v in vacancies if percolator.match(v)], expected)
+
+    def test_remove_search(self):
+        """Тест удаления поиска"""
+        self.percolator.remove_search("dev")
+        self.percolator.remove_search("rich")
+        self.percolator.remove_search("missing")
+
+        self.assertEqual(sorted(self.percolator.match(self.java)), ["backend"])
+        self.assertEqual(len(self.percolator), 3)
+
+    def test_notifications_from_saver(self):
+        """Тест уведомлений после add_vacancies"""
+        test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, test_dir, True)
+        notifications = []
+        percolator = SearchPercolator(lambda search_id, vacancy: notifications.append((search_id, vacancy['url'])))
+        percolator.add_search("python", ["python"])
+
+        saver = JSONSaver(os.path.join(test_dir, "vacancies.json"))
+        saver.add_listener(percolator)
+        saver.add_vacancies([self.python, self.java])
+        saver.add_vacancies([self.python])  # Повторное добавление не уведомляет
+
+        self.assertEqual(notifications, [("python", self.python.url)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.vacancy import Vacancy
+from src.saver import JSONSaver
+from src.analytics import SalaryAnalytics, SalarySummary
+
+
+class TestSalarySummary(unittest.TestCase):
+
+    def test_quantiles_and_removal(self):
+        """Тест квантилей и удаления значений"""
+        summary = SalarySummary(relative_accuracy=0.01)
+        for value in range(1, 101):
+            summary.add(value * 1000)
+
+        self.assertEqual(summary.count, 100)
+        self.assertAlmostEqual(summary.mean, 50500)
+        self.assertAlmostEqual(summary.median, 50000, delta=50000 * 0.01)
+        self.assertAlmostEqual(summary.quantile(0.9), 90000, delta=90000 * 0.01)
+
+        for value in range(51, 101):
+            summary.remove(value * 1000)
+        self.assertEqual(summary.count, 50)
+        self.assertAlmostEqual(summary.quantile(1.0), 50000, delta=50000 * 0.01)
+        self.assertEqual(sum(summary.histogram(10000).values()), 50)
+
+    def test_quantile_after_new_and_removed_buckets(self):
+        """Тест обновления квантилей между запросами при появлении и исчезновении корзин"""
+        summary = SalarySummary(relative_accuracy=0.01)
+        summary.add(100000)
+        self.assertAlmostEqual(summary.quantile(1.0), 100000, delta=100000 * 0.01)
+
+        summary.add(500000)
+        summary.add(100000)  # Существующая корзина
+        self.assertAlmostEqual(summary.quantile(1.0), 500000, delta=500000 * 0.01)
+        self.assertAlmostEqual(summary.quantile(0.0), 100000, delta=100000 * 0.01)
+
+        summary.remove(500000)
+        self.assertAlmostEqual(summary.quantile(1.0), 100000, delta=100000 * 0.01)
+
+
+class TestSalaryAnalytics(unittest.TestCase):
+
+    def setUp(self):
+        """Создание хранилища с подписанной аналитикой"""
+        self.test_dir = tempfile.mkdtemp()
+        self.saver = JSONSaver(os.path.join(self.test_dir, "vacancies.json"))
+        self.analytics = SalaryAnalytics()
+        self.saver.add_listener(self.analytics)
+
+        self.python = Vacancy("Python Developer", "https://hh.ru/vacancy/1",
+                              {"from": 100000, "to": 100000, "currency": "RUR"}, "", "Company A")
+        self.senior = Vacancy("Senior Python Developer", "https://hh.ru/vacancy/2",
+                              {"from": 300000, "to": 300000, "currency": "RUR"}, "", "Company A")
+        self.java = Vacancy("Java Developer", "https://hh.ru/vacancy/3",
+                            {"from": 3000, "to": 3000, "currency": "USD"}, "", "Company B")
+        self.no_salary = Vacancy("Python Intern", "https://hh.ru/vacancy/4", {}, "", "Company B")
+
+    def tearDown(self):
+        """Удаление временных файлов"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_updates_on_add_and_delete(self):
+        """Тест обновления сводок при добавлении и удалении"""
+        self.saver.add_vacancies([self.python, self.senior, self.java, self.no_salary])
+
+        self.assertEqual(self.analytics.summary("word", "Python").count, 2)
+        self.assertEqual(self.analytics.summary("employer", "Company A").mean, 200000)
+        self.assertEqual(self.analytics.summary("all", currency="USD").count, 1)
+        self.assertIsNone(self.analytics.summary("title", "Python Intern"))
+
+        self.saver.delete_vacancy(self.senior)
+        self.assertAlmostEqual(self.analytics.median("word", "python"), 100000, delta=1000)
+
+        self.saver.clear_file()
+        self.assertIsNone(self.analytics.summary())
+
+    def test_from_records(self):
+        """Тест построения аналитики по сохраненным вакансиям"""
+        self.saver.add_vacancies([self.python, self.senior])
+        analytics = SalaryAnalytics.from_records(self.saver.get_vacancies())
+
+        self.assertEqual(analytics.summary().count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
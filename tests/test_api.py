@@ -1,10 +1,24 @@
 import unittest
 import sys
 import os
+import threading
+from unittest.mock import patch
+
+import requests
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from src.api import HeadHunterAPI
+from src.api import HeadHunterAPI, RateLimiter
+from src.replay import ResponseArchive, create_stub_server
+
+
+def http_error(status, retry_after=None):
+    """Ошибка HTTP с указанным статусом ответа"""
+    response = requests.Response()
+    response.status_code = status
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return requests.HTTPError(f"{status} Error", response=response)
 
 
 class TestHeadHunterAPI(unittest.TestCase):
@@ -18,10 +32,66 @@ class TestHeadHunterAPI(unittest.TestCase):
         self.assertIsInstance(self.api, HeadHunterAPI)
 
     def test_get_vacancies_method(self):
-        """Тест метода получения вакансий"""
+        """Тест метода получения вакансий (через локальную заглушку API)"""
+        archive = ResponseArchive()
+        archive.add("Python", "113", [{"id": "1", "name": "Python Developer"}])
+        server = create_stub_server(archive)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        api = HeadHunterAPI(f"http://127.0.0.1:{server.server_address[1]}/vacancies")
+
         # Метод должен возвращать список
-        vacancies = self.api.get_vacancies("Python")
+        vacancies = api.get_vacancies("Python")
         self.assertIsInstance(vacancies, list)
+        self.assertEqual(vacancies, [{"id": "1", "name": "Python Developer"}])
+
+    def test_search_batch_deduplicates(self):
+        """Тест пакетного поиска с удалением дубликатов"""
+        responses = {
+            ("Python", "1"): [{"id": "1"}, {"id": "2"}],
+            ("Python", "2"): [{"id": "2"}, {"id": "3"}],
+            ("Django", "1"): [{"id": "1"}],
+            ("Django", "2"): [{"id": "4"}],
+        }
+
+        with patch.object(HeadHunterAPI, "_fetch_vacancies",
+                          side_effect=lambda query, area: responses[(query, area)]) as mocked:
+            items = list(self.api.search_batch(["Python", "Django", "Python"], ["1", "2"], max_workers=2))
+
+        self.assertEqual(mocked.call_count, 4)  # Повторный запрос не отправляется
+        self.assertEqual(sorted(item["id"] for item in items), ["1", "2", "3", "4"])
+
+    def test_search_batch_retries(self):
+        """Тест повтора запросов после ответов 429 и 500"""
+        responses = [http_error(429, retry_after="0"), http_error(500), [{"id": "1"}]]
+        limiter = RateLimiter()
+
+        with patch.object(HeadHunterAPI, "_fetch_vacancies", side_effect=responses) as mocked, \
+                patch.object(limiter, "pause", wraps=limiter.pause) as pause:
+            items = list(self.api.search_batch(["Python"], ["1"], limiter=limiter, backoff=0))
+
+        self.assertEqual(items, [{"id": "1"}])
+        self.assertEqual(mocked.call_count, 3)
+        pause.assert_called_once_with(0.0)
+
+    def test_search_batch_reports_failed(self):
+        """Тест передачи вызывающему коду пар, не полученных после всех повторов"""
+        def fetch(query, area):
+            if query == "Django":
+                raise http_error(503)
+            if area == "2":
+                raise http_error(404)
+            return [{"id": query + area}]
+
+        failed = []
+        with patch.object(HeadHunterAPI, "_fetch_vacancies", side_effect=fetch) as mocked:
+            items = list(self.api.search_batch(["Python", "Django"], ["1", "2"], max_workers=1,
+                                               max_retries=2, backoff=0, failed=failed))
+
+        self.assertEqual(items, [{"id": "Python1"}])
+        self.assertEqual(sorted(failed), [("Django", "1"), ("Django", "2"), ("Python", "2")])
+        self.assertEqual(mocked.call_count, 1 + 1 + 3 + 3)  # 404 не повторяется
 
 
 if __name__ == '__main__':
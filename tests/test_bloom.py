@@ -0,0 +1,104 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.vacancy import Vacancy
+from src.saver import JSONSaver
+from src.bloom import BloomFilter, SeenVacancyFilter
+
+
+def api_item(i):
+    """Вакансия в формате ответа API"""
+    return {"id": str(i), "name": f"Developer {i}", "alternate_url": f"https://hh.ru/vacancy/{i}",
+            "salary": None, "snippet": {}, "employer": {"name": "Company"}}
+
+
+class TestBloomFilter(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_membership_and_error_rate(self):
+        """Тест отсутствия ложноотрицательных ответов и доли ложноположительных"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"key {i}")
+
+        self.assertTrue(all(f"key {i}" in bloom for i in range(1000)))
+        false_positives = sum(f"other {i}" in bloom for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+    def test_save_and_load(self):
+        """Тест сохранения фильтра в файл"""
+        filename = os.path.join(self.test_dir, "seen.bloom")
+        bloom = BloomFilter(capacity=100)
+        bloom.add("https://hh.ru/vacancy/1")
+        bloom.save(filename)
+
+        loaded = BloomFilter.load(filename)
+        self.assertIn("https://hh.ru/vacancy/1", loaded)
+        self.assertEqual(len(loaded), 1)
+
+
+class TestSeenVacancyFilter(unittest.TestCase):
+
+    def setUp(self):
+        """Создание хранилища с подписанным фильтром"""
+        self.test_dir = tempfile.mkdtemp()
+        self.saver = JSONSaver(os.path.join(self.test_dir, "vacancies.json"))
+        self.bloom_file = os.path.join(self.test_dir, "seen.bloom")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_filter_new(self):
+        """Тест отбрасывания уже сохраненных вакансий до преобразования"""
+        seen = SeenVacancyFilter(self.saver, self.bloom_file, capacity=1000)
+        self.saver.add_listener(seen)
+
+        items = [api_item(i) for i in range(5)]
+        self.saver.add_vacancies(Vacancy.cast_to_object_list(seen.filter_new(items)))
+
+        fresh = seen.filter_new([api_item(i) for i in range(3, 8)])
+        self.assertEqual([item["id"] for item in fresh], ["5", "6", "7"])
+
+        # Фильтр восстанавливается из файла
+        restored = SeenVacancyFilter(self.saver, self.bloom_file, capacity=1000)
+        self.assertEqual(len(restored.bloom), 5)
+        self.assertEqual(len(restored.filter_new(items)), 0)
+
+    def test_single_confirmation_pass(self):
+        """Тест точной проверки положительных ответов за один проход по хранилищу"""
+        seen = SeenVacancyFilter(self.saver, capacity=1000)
+        self.saver.add_listener(seen)
+        self.saver.add_vacancies(Vacancy.cast_to_object_list([api_item(i) for i in range(5)]))
+
+        with patch.object(self.saver, "iter_vacancies", wraps=self.saver.iter_vacancies) as iter_vacancies:
+            fresh = seen.filter_new([api_item(i) for i in range(10)])
+        self.assertEqual([item["id"] for item in fresh], ["5", "6", "7", "8", "9"])
+        self.assertEqual(iter_vacancies.call_count, 1)
+
+    def test_delete_and_clear(self):
+        """Тест удаления и очистки хранилища"""
+        seen = SeenVacancyFilter(self.saver, capacity=1000)
+        self.saver.add_listener(seen)
+        vacancies = Vacancy.cast_to_object_list([api_item(1), api_item(2)])
+        self.saver.add_vacancies(vacancies)
+
+        self.saver.delete_vacancy(vacancies[0])
+        self.assertEqual([item["id"] for item in seen.filter_new([api_item(1), api_item(2)])], ["1"])
+
+        self.saver.clear_file()
+        self.assertEqual(len(seen.filter_new([api_item(1), api_item(2)])), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
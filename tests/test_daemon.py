@@ -0,0 +1,126 @@
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.vacancy import Vacancy
+from src.saver import JSONSaver
+from src.daemon import DaemonClient, connect_saver, create_server
+
+
+class TestDaemon(unittest.TestCase):
+
+    def setUp(self):
+        """Запуск демона на свободном порту"""
+        self.test_dir = tempfile.mkdtemp()
+        self.test_file = os.path.join(self.test_dir, "vacancies.json")
+
+        self.vacancy1 = Vacancy("Python Developer", "https://hh.ru/vacancy/1",
+                                {"from": 100000, "to": 150000, "currency": "RUR"}, "Django", "Company A")
+        self.vacancy2 = Vacancy("Java Developer", "https://hh.ru/vacancy/2",
+                                {"from": 120000, "to": 180000, "currency": "RUR"}, "Spring", "Company B")
+        self.vacancy3 = Vacancy("Frontend Developer", "https://hh.ru/vacancy/3", {}, "React", "Company C")
+        JSONSaver(self.test_file).add_vacancies([self.vacancy1])
+
+        self.server = create_server(self.test_file, port=0)
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.client = DaemonClient(port=self.port)
+
+    def tearDown(self):
+        """Остановка демона и удаление временных файлов"""
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_queries(self):
+        """Тест запросов к демону"""
+        self.assertTrue(self.client.is_available())
+        self.client.add_vacancies([self.vacancy1, self.vacancy2, self.vacancy3])
+
+        self.assertEqual(len(self.client.get_vacancies()), 3)
+        self.assertEqual(self.client.get_vacancies({"keyword": "spring"})[0]['title'], "Java Developer")
+        self.assertEqual(len(self.client.get_vacancies(limit=1, offset=1)), 1)
+
+        top = self.client.get_top_vacancies_by_salary(5)
+        self.assertEqual([v['title'] for v in top], ["Java Developer", "Python Developer"])
+        after = (top[0]['average_salary'], top[0]['url'])
+        self.assertEqual(self.client.get_top_vacancies_by_salary(5, after=after)[0]['title'], "Python Developer")
+
+        ranged = self.client.get_vacancies_by_salary_range(100000, 130000)
+        self.assertEqual([v['title'] for v in ranged], ["Python Developer"])
+
+        # Порядок выборки по диапазону совпадает с JSONSaver
+        ranged = self.client.get_vacancies_by_salary_range(0, limit=2)
+        self.assertEqual(ranged, JSONSaver(self.test_file).get_vacancies_by_salary_range(0, limit=2))
+        self.assertEqual([v['title'] for v in ranged], ["Java Developer", "Python Developer"])
+
+    def _post(self, command, body):
+        request = urllib.request.Request(f"http://127.0.0.1:{self.port}/{command}", data=body)
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            urllib.request.urlopen(request, timeout=5)
+        with context.exception as error:
+            return error.code, json.load(error)["error"]
+
+    def test_bad_requests(self):
+        """Тест ответа 400 на некорректное тело запроса"""
+        self.assertEqual(self._post("search", b"[1, 2]")[0], 400)
+
+        status, error = self._post("top", b"{}")
+        self.assertEqual(status, 400)
+        self.assertIn("'n'", error)
+
+        self.assertEqual(self._post("unknown", b"{}")[0], 404)
+
+        for command, body in (("search", b'{"criteria": [1]}'),
+                              ("search", b'{"criteria": {"$not": [1]}}'),
+                              ("search", b'{"limit": "a"}'),
+                              ("salary_range", b'{"min_salary": "a"}'),
+                              ("top", b'{"n": 1, "after": [1]}'),
+                              ("delete", b'{"vacancy": 1}'),
+                              ("add", b'{"vacancies": [1]}')):
+            self.assertEqual(self._post(command, body)[0], 400, body)
+
+    def test_invalid_records_are_not_stored(self):
+        """Тест отказа от некорректных записей без изменения хранилища"""
+        status, error = self._post("add", b'{"vacancies": [{"url": "u2", "average_salary": 1}, '
+                                          b'{"url": "u3", "average_salary": "x"}]}')
+        self.assertEqual(status, 400)
+        self.assertIn("average_salary", error)
+        self.assertEqual(len(self.client.get_vacancies()), 1)
+
+        self.client.add_vacancy(self.vacancy2)
+        self.assertEqual([v['title'] for v in JSONSaver(self.test_file).get_vacancies()],
+                         ["Python Developer", "Java Developer"])
+
+    def test_changes_are_persisted(self):
+        """Тест записи изменений в файл"""
+        self.client.add_vacancy(self.vacancy2)
+        self.client.delete_vacancy(self.vacancy1)
+
+        self.assertEqual([v['title'] for v in JSONSaver(self.test_file).get_vacancies()], ["Java Developer"])
+
+        self.client.clear_file()
+        self.assertEqual(JSONSaver(self.test_file).get_vacancies(), [])
+
+    def test_connect_saver(self):
+        """Тест выбора между демоном и JSONSaver"""
+        self.assertIsInstance(connect_saver(self.test_file, port=self.port), DaemonClient)
+
+        # Порт, на котором демон не запущен
+        free_server = create_server(self.test_file, port=0)
+        free_port = free_server.server_address[1]
+        free_server.server_close()
+        self.assertIsInstance(connect_saver(self.test_file, port=free_port), JSONSaver)
+
+
+if __name__ == '__main__':
+    unittest.main()
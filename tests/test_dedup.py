@@ -0,0 +1,46 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.vacancy import Vacancy
+from src.dedup import NearDuplicateDetector
+
+
+class TestNearDuplicateDetector(unittest.TestCase):
+
+    def setUp(self):
+        """Создание тестовых вакансий"""
+        description = ("Разработка и поддержка backend сервисов на Python и Django. "
+                       "Проектирование REST API, работа с PostgreSQL и Redis, написание тестов, "
+                       "участие в code review и планировании задач команды.")
+        self.original = Vacancy("Python Developer", "https://hh.ru/vacancy/1", {}, description, "Company A")
+        self.repost = Vacancy("Python Developer", "https://hh.ru/vacancy/2", {},
+                              description.replace("Redis", "<highlighttext>Redis</highlighttext>"), "Company A")
+        self.other = Vacancy("Водитель", "https://hh.ru/vacancy/3", {},
+                             "Управление автомобилем, перевозка грузов по городу.", "Company B")
+
+    def test_deduplicate(self):
+        """Тест удаления почти одинаковых вакансий"""
+        detector = NearDuplicateDetector()
+        unique = detector.deduplicate([self.original, self.repost, self.other])
+
+        self.assertEqual([v.url for v in unique], [self.original.url, self.other.url])
+        self.assertEqual(len(detector), 2)
+
+    def test_find_duplicates_in_dicts(self):
+        """Тест поиска дубликатов среди сохраненных словарей"""
+        detector = NearDuplicateDetector()
+        records = [self.original.to_dict(), self.other.to_dict(), self.repost.to_dict()]
+
+        self.assertEqual(detector.find_duplicates(records), [(self.repost.url, self.original.url)])
+
+    def test_invalid_bands(self):
+        """Тест проверки параметров LSH"""
+        with self.assertRaises(ValueError):
+            NearDuplicateDetector(num_perm=64, bands=10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import sys
+import os
+import random
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matcher import KeywordMatcher
+from src.utils import MATCHER_MIN_WORDS, filter_vacancies
+from src.vacancy import Vacancy
+
+
+class TestKeywordMatcher(unittest.TestCase):
+
+    def test_find(self):
+        """Тест поиска нескольких слов"""
+        matcher = KeywordMatcher(["he", "she", "his", "hers", "Python"])
+        self.assertEqual(matcher.find("USHERS"), {"he", "she", "hers"})
+        self.assertEqual(matcher.find("python developer"), {"Python"})
+        self.assertEqual(matcher.find("java"), set())
+
+    def test_same_result_as_substring_search(self):
+        """Тест совпадения с проверкой через оператор in"""
+        rng = random.Random(1)
+        words = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(20)]
+        matcher = KeywordMatcher(words)
+        for _ in range(200):
+            text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 30)))
+            self.assertEqual(matcher.find(text), {word for word in words if word in text})
+
+    def test_whole_word_and_case(self):
+        """Тест режимов целых слов и учета регистра"""
+        matcher = KeywordMatcher(["java", "go"], whole_word=True)
+        self.assertEqual(matcher.find("JavaScript, Go"), {"go"})
+        self.assertFalse(matcher.matches("golang"))
+
+        matcher = KeywordMatcher(["Python"], ignore_case=False)
+        self.assertFalse(matcher.matches("python"))
+        self.assertTrue(matcher.matches("Python"))
+
+    def test_empty_word(self):
+        """Тест пустого слова (совпадает с любым текстом, как оператор in)"""
+        self.assertTrue(KeywordMatcher(["python", ""]).matches("java"))
+        self.assertFalse(KeywordMatcher([""], whole_word=True).matches("java"))
+
+
+class TestFilterVacancies(unittest.TestCase):
+
+    def setUp(self):
+        """Создание тестовых вакансий"""
+        self.vacancies = [
+            Vacancy("Python Developer", "https://hh.ru/vacancy/1", {}, "Django", "Company A"),
+            Vacancy("Java Developer", "https://hh.ru/vacancy/2", {}, "Spring, JavaScript", "Company B"),
+            Vacancy("Frontend Developer", "https://hh.ru/vacancy/3", {}, "React, JavaScript", "Company C"),
+        ]
+
+    def test_filter_vacancies(self):
+        """Тест фильтрации по ключевым словам"""
+        titles = [v.title for v in filter_vacancies(self.vacancies, ["DJANGO", "spring"])]
+        self.assertEqual(titles, ["Python Developer", "Java Developer"])
+
+        titles = [v.title for v in filter_vacancies(self.vacancies, ["java"])]
+        self.assertEqual(titles, ["Java Developer", "Frontend Developer"])
+
+        titles = [v.title for v in filter_vacancies(self.vacancies, ["java"], whole_word=True)]
+        self.assertEqual(titles, ["Java Developer"])
+
+        self.assertEqual(len(filter_vacancies(self.vacancies, [])), 3)
+
+    def test_long_word_list_uses_matcher(self):
+        """Тест длинного списка слов (фильтрация через KeywordMatcher)"""
+        words = [f"missing{i}" for i in range(MATCHER_MIN_WORDS)] + ["REACT"]
+        titles = [v.title for v in filter_vacancies(self.vacancies, words)]
+        self.assertEqual(titles, ["Frontend Developer"])
+
+
+if __name__ == '__main__':
+    unittest.main()
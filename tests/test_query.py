@@ -0,0 +1,91 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.query import compile_criteria
+
+
+class TestCompileCriteria(unittest.TestCase):
+
+    def setUp(self):
+        """Создание тестовых данных"""
+        self.python = {
+            "title": "Python Developer",
+            "url": "https://hh.ru/vacancy/123",
+            "salary": {"from": 100000, "to": 150000, "currency": "RUR"},
+            "description": "Разработка на Python, Django",
+            "employer": "Company A",
+            "average_salary": 125000.0
+        }
+        self.java = {
+            "title": "Java Developer",
+            "url": "https://hh.ru/vacancy/124",
+            "salary": {"from": 2000, "to": 3000, "currency": "USD"},
+            "description": "Разработка на Java, Spring",
+            "employer": "Company B",
+            "average_salary": 2500.0
+        }
+        self.vacancies = [self.python, self.java]
+
+    def _titles(self, criteria):
+        predicate = compile_criteria(criteria)
+        return [v["title"] for v in self.vacancies if predicate(v)]
+
+    def test_empty_criteria(self):
+        """Тест пустых критериев"""
+        self.assertEqual(len(self._titles(None)), 2)
+        self.assertEqual(len(self._titles({})), 2)
+
+    def test_legacy_criteria(self):
+        """Тест прежних критериев"""
+        self.assertEqual(self._titles({"keyword": "django"}), ["Python Developer"])
+        self.assertEqual(self._titles({"title": "java"}), ["Java Developer"])
+        self.assertEqual(self._titles({"salary_min": "100000"}), ["Python Developer"])
+        self.assertEqual(self._titles({"employer": "Company B"}), ["Java Developer"])
+        # Поле, которого нет в вакансии, не участвует в фильтрации
+        self.assertEqual(len(self._titles({"unknown": "x"})), 2)
+
+    def test_range_and_in(self):
+        """Тест диапазонов и оператора $in"""
+        self.assertEqual(self._titles({"average_salary": {"$gte": 1000, "$lt": 3000}}), ["Java Developer"])
+        self.assertEqual(self._titles({"salary.currency": {"$in": ["USD", "EUR"]}}), ["Java Developer"])
+        self.assertEqual(self._titles({"salary.currency": {"$nin": ["USD"]}}), ["Python Developer"])
+        self.assertEqual(self._titles({"salary_max": 3000}), ["Java Developer"])
+
+    def test_logical_operators(self):
+        """Тест операторов $and, $or, $not"""
+        criteria = {"$or": [{"keyword": "spring"}, {"salary_min": 120000}]}
+        self.assertEqual(len(self._titles(criteria)), 2)
+
+        criteria = {"$and": [{"title": "developer"}, {"$not": {"keyword": "java"}}]}
+        self.assertEqual(self._titles(criteria), ["Python Developer"])
+
+    def test_unknown_operator(self):
+        """Тест неизвестного оператора"""
+        with self.assertRaises(ValueError):
+            compile_criteria({"average_salary": {"$between": [1, 2]}})
+
+    def test_invalid_sequence_operands(self):
+        """Тест отказа от операндов $in, $nin, $and и $or, не являющихся списком, и критериев не словарем"""
+        for criteria in ({"employer": {"$in": "Yandex"}},
+                         {"employer": {"$nin": {"Yandex": 1}}},
+                         {"$and": {"title": "developer"}},
+                         {"$or": "developer"},
+                         {"$and": [1]},
+                         {"$or": ["x"]},
+                         {"$not": [1]},
+                         {"keyword": 1},
+                         {"title": ["python"]}):
+            with self.assertRaises(ValueError):
+                compile_criteria(criteria)
+
+        with self.assertRaises(ValueError):
+            compile_criteria([{"title": "python"}])
+
+        compile_criteria({"employer": {"$in": ("Yandex", "VK")}, "$or": [{"title": "python"}]})
+
+
+if __name__ == '__main__':
+    unittest.main()
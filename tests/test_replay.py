@@ -0,0 +1,96 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import threading
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.api import HeadHunterAPI
+from src.replay import RecordingAPI, ReplayAPI, ResponseArchive, create_stub_server, run_load_test
+
+
+class FakeAPI:
+    """API с фиксированными ответами"""
+
+    def get_vacancies(self, search_query, area="113"):
+        return [{"id": str(i), "name": f"{search_query} {i}"} for i in range(150)]
+
+
+class TestReplay(unittest.TestCase):
+
+    def setUp(self):
+        """Запись архива"""
+        self.test_dir = tempfile.mkdtemp()
+        self.archive_file = os.path.join(self.test_dir, "archive.json")
+
+        recorder = RecordingAPI(ResponseArchive(self.archive_file), FakeAPI())
+        recorder.get_vacancies("Python", "1")
+        recorder.archive.save()
+        self.archive = ResponseArchive(self.archive_file)
+
+    def tearDown(self):
+        """Удаление временных файлов"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _start(self, **kwargs):
+        server = create_stub_server(self.archive, seed=1, **kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server, HeadHunterAPI(f"http://127.0.0.1:{server.server_address[1]}/vacancies")
+
+    def test_replay_archive(self):
+        """Тест воспроизведения архива без сети"""
+        self.assertEqual(self.archive.recorded_requests(), [("Python", "1")])
+        self.assertEqual(len(ReplayAPI(self.archive).get_vacancies("Python", "1")), 150)
+        self.assertEqual(ReplayAPI(self.archive).get_vacancies("Java", "1"), [])
+
+    def test_failed_requests_are_not_recorded(self):
+        """Тест записи только успешных ответов"""
+        server, api = self._start(error_rate=1.0)
+        recorder = RecordingAPI(ResponseArchive(), api)
+        self.assertEqual(recorder.get_vacancies("Python", "1"), [])
+        self.assertEqual(recorder.archive.recorded_requests(), [])
+
+        server, api = self._start()
+        recorder = RecordingAPI(ResponseArchive(), api)
+        self.assertEqual(len(recorder.get_vacancies("Python", "1")), 100)
+        self.assertEqual(recorder.archive.recorded_requests(), [("Python", "1")])
+
+    def test_stub_server_pagination(self):
+        """Тест выдачи архива заглушкой с постраничной разбивкой"""
+        server, api = self._start()
+        items = api.get_vacancies("Python", "1")
+
+        self.assertEqual(len(items), 100)  # Клиент запрашивает первую страницу по 100
+        self.assertEqual(items[0]["name"], "Python 0")
+        self.assertEqual(server.stats.counts, {200: 1})
+
+    def test_stub_server_errors_and_load(self):
+        """Тест ошибок заглушки и нагрузочного теста"""
+        server, api = self._start(throttle_rate=1.0)
+        self.assertEqual(api.get_vacancies("Python", "1"), [])
+        self.assertEqual(server.stats.counts, {429: 1})
+
+        server, api = self._start()
+        result = run_load_test(api, [("Python", "1")] * 10, concurrency=4)
+        self.assertEqual(result["requests"], 10)
+        self.assertGreater(result["throughput"], 0)
+        self.assertLessEqual(result["p50"], result["max"])
+        self.assertEqual(result["failed"], 0)
+
+    def test_load_test_counts_failures(self):
+        """Тест подсчета ошибок нагрузочного теста на стороне клиента"""
+        server, api = self._start(error_rate=0.5)
+        result = run_load_test(api, [("Python", "1")] * 20, concurrency=4)
+
+        self.assertEqual(result["requests"], 20)
+        self.assertEqual(result["failed"], server.stats.counts.get(500, 0))
+        self.assertGreater(result["failed"], 0)
+        self.assertLess(result["failed"], 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,11 +3,13 @@ import sys
 import os
 import json
 import tempfile
+from unittest.mock import patch
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.vacancy import Vacancy
-from src.saver import JSONSaver
+from src.abstract_classes import VacancyListener
+from src.saver import JSONSaver, salary_cursor
 
 
 class TestJSONSaver(unittest.TestCase):
@@ -169,6 +171,147 @@ class TestJSONSaver(unittest.TestCase):
         top_vacancies = self.saver.get_top_vacancies_by_salary(10)
         self.assertEqual(len(top_vacancies), 2)  # Только вакансии с зарплатой > 0
 
+    def test_get_vacancies_page(self):
+        """Тест постраничного получения вакансий"""
+        self.saver.add_vacancies([self.vacancy1, self.vacancy2, self.vacancy3])
+
+        page = self.saver.get_vacancies(limit=2)
+        self.assertEqual([v['title'] for v in page], ["Python Developer", "Java Developer"])
+
+        page = self.saver.get_vacancies({"keyword": "Разработка"}, limit=2, offset=2)
+        self.assertEqual([v['title'] for v in page], ["Frontend Developer"])
+
+        # Выборка по диапазону отсортирована по убыванию зарплаты
+        page = self.saver.get_vacancies_by_salary_range(100000, 200000, limit=1)
+        self.assertEqual([v['title'] for v in page], ["Java Developer"])
+        page = self.saver.get_vacancies_by_salary_range(100000, 200000, limit=1, offset=1)
+        self.assertEqual([v['title'] for v in page], ["Python Developer"])
+
+    def test_top_vacancies_cursor(self):
+        """Тест постраничного топа по зарплате с курсором"""
+        self.saver.add_vacancies([self.vacancy1, self.vacancy2, self.vacancy3])
+
+        first_page = self.saver.get_top_vacancies_by_salary(1)
+        self.assertEqual(first_page[0]['title'], "Java Developer")
+
+        second_page = self.saver.get_top_vacancies_by_salary(1, after=salary_cursor(first_page[-1]))
+        self.assertEqual([v['title'] for v in second_page], ["Python Developer"])
+
+        last_page = self.saver.get_top_vacancies_by_salary(1, after=salary_cursor(second_page[-1]))
+        self.assertEqual(last_page, [])
+
+    def test_iter_vacancies_large_file(self):
+        """Тест потокового чтения файла, превышающего размер блока чтения"""
+        vacancies = [Vacancy(f"Developer {i}", f"https://hh.ru/vacancy/{i}", {},
+                             "Описание " * 200, "Company") for i in range(100)]
+        self.saver.add_vacancies(vacancies)
+
+        self.assertEqual(len(list(self.saver.iter_vacancies())), 100)
+        self.assertEqual(self.saver.get_vacancies(limit=1, offset=99)[0]['title'], "Developer 99")
+
+    def test_encoded_format(self):
+        """Тест компактного формата со словарным кодированием"""
+        encoded_saver = JSONSaver(os.path.join(self.test_dir, "encoded.json"), encoded=True)
+        encoded_saver.add_vacancies([self.vacancy1, self.vacancy2, self.vacancy3])
+
+        with open(encoded_saver.filename, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data[0]["dimensions"]["currency"], ["RUR", "Зарплата не указана"])
+
+        expected = [v.to_dict() for v in (self.vacancy1, self.vacancy2, self.vacancy3)]
+        self.assertEqual(encoded_saver.get_vacancies(), expected)
+        self.assertEqual(list(encoded_saver.iter_vacancies()), expected)
+
+        # Обычный saver читает закодированный файл
+        self.assertEqual(JSONSaver(encoded_saver.filename).get_vacancies({"title": "Java"}), [expected[1]])
+
+    def test_compressed_storage(self):
+        """Тест сжатого хранения"""
+        vacancies = [self.vacancy1, self.vacancy2, self.vacancy3]
+        expected = [v.to_dict() for v in vacancies]
+
+        for filename, compression, magic in (("vacancies.json.gz", None, b"\x1f\x8b"),
+                                             ("vacancies.xz.json", "lzma", b"\xfd7zXZ")):
+            saver = JSONSaver(os.path.join(self.test_dir, filename), compression=compression,
+                              compression_level=1)
+            saver.add_vacancies(vacancies)
+
+            with open(saver.filename, 'rb') as f:
+                self.assertTrue(f.read().startswith(magic))
+            self.assertEqual(saver.get_vacancies(), expected)
+            self.assertEqual(saver.get_vacancies({"title": "Java"}, limit=1), [expected[1]])
+
+            # Формат определяется при чтении по содержимому файла
+            self.assertEqual(JSONSaver(saver.filename, compression=None).get_vacancies(), expected)
+
+        with self.assertRaises(ValueError):
+            JSONSaver(self.test_file, compression="zip")
+
+    def test_buffered_writer(self):
+        """Тест буферизованной записи с групповой фиксацией"""
+        self.saver.add_vacancy(self.vacancy3)
+
+        with self.saver.buffered(max_pending=100, max_delay=None) as writer:
+            writer.add_vacancy(self.vacancy1)
+            writer.add_vacancy(self.vacancy1)  # Дубликат не добавляется
+            writer.add_vacancy(self.vacancy2)
+            writer.delete_vacancy(self.vacancy3)
+            self.assertEqual(len(writer), 4)
+            # До фиксации файл не меняется
+            self.assertEqual([v['title'] for v in self.saver.get_vacancies()], ["Frontend Developer"])
+
+        self.assertEqual([v['title'] for v in self.saver.get_vacancies()], ["Python Developer", "Java Developer"])
+
+    def test_buffered_writer_thresholds(self):
+        """Тест фиксации по размеру очереди и по времени"""
+        writer = self.saver.buffered(max_pending=2, max_delay=None)
+        writer.add_vacancy(self.vacancy1)
+        self.assertEqual(self.saver.get_vacancies(), [])
+        writer.add_vacancy(self.vacancy2)
+        self.assertEqual(len(writer), 0)
+        self.assertEqual(len(self.saver.get_vacancies()), 2)
+
+        writer = self.saver.buffered(max_pending=100, max_delay=0)
+        writer.delete_vacancy(self.vacancy1)
+        self.assertEqual(len(self.saver.get_vacancies()), 1)
+        self.assertEqual(writer.flush(), (0, 0))
+
+    def test_buffered_writer_failed_write_keeps_queue(self):
+        """Тест сохранения очереди при ошибке записи файла"""
+        writer = self.saver.buffered(max_pending=100, max_delay=None)
+        writer.add_vacancy(self.vacancy1)
+        writer.add_vacancy(self.vacancy2)
+
+        with patch.object(JSONSaver, "_save_vacancies", side_effect=OSError("Диск заполнен")):
+            with self.assertRaises(OSError):
+                writer.flush()
+        self.assertEqual(len(writer), 2)
+
+        self.assertEqual(writer.flush(), (2, 0))
+        self.assertEqual(len(self.saver.get_vacancies()), 2)
+
+    def test_buffered_writer_cancels_add_delete_pairs(self):
+        """Тест отмены добавления и удаления одной вакансии в одной фиксации"""
+        notifications = []
+
+        class Listener(VacancyListener):
+            def on_add(self, vacancies):
+                notifications.extend(("add", v['title']) for v in vacancies)
+
+            def on_delete(self, vacancy):
+                notifications.append(("delete", vacancy['title']))
+
+        self.saver.add_vacancy(self.vacancy3)
+        self.saver.add_listener(Listener())
+        with self.saver.buffered(max_delay=None) as writer:
+            writer.add_vacancy(self.vacancy1)
+            writer.delete_vacancy(self.vacancy1)
+            writer.add_vacancy(self.vacancy2)
+            writer.delete_vacancy(self.vacancy3)
+
+        self.assertEqual(notifications, [("add", "Java Developer"), ("delete", "Frontend Developer")])
+        self.assertEqual([v['title'] for v in self.saver.get_vacancies()], ["Java Developer"])
+
     def test_empty_file(self):
         """Тест работы с пустым файлом"""
         # Создаем новый saver с несуществующим файлом
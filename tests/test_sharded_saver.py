@@ -0,0 +1,95 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.vacancy import Vacancy
+from src.sharded_saver import ShardedJSONSaver, hash_partition
+
+
+class TestShardedJSONSaver(unittest.TestCase):
+
+    def setUp(self):
+        """Создание тестовых данных и временного каталога"""
+        self.test_dir = tempfile.mkdtemp()
+        self.saver = ShardedJSONSaver(self.test_dir, num_shards=4, max_workers=1)
+
+        self.vacancies = [
+            Vacancy(f"Developer {i}", f"https://hh.ru/vacancy/{i}",
+                    {"from": i * 10000, "to": i * 10000, "currency": "RUR"},
+                    "Описание", f"Company {i % 3}")
+            for i in range(1, 21)
+        ]
+
+    def tearDown(self):
+        """Удаление временных файлов"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_add_vacancies_spreads_over_shards(self):
+        """Тест распределения вакансий по шардам"""
+        self.saver.add_vacancies(self.vacancies)
+        self.saver.add_vacancies(self.vacancies)  # Повторное добавление ничего не меняет
+
+        self.assertGreater(len(self.saver.shards()), 1)
+        self.assertEqual(len(self.saver.get_vacancies()), 20)
+
+    def test_hash_partition_is_stable(self):
+        """Тест стабильности разбиения по хэшу"""
+        partition = hash_partition(4)
+        vacancy = self.vacancies[0].to_dict()
+        self.assertEqual(partition(vacancy), partition(dict(vacancy)))
+
+    def test_queries(self):
+        """Тест запросов по всем шардам"""
+        self.saver.add_vacancies(self.vacancies)
+
+        found = self.saver.get_vacancies({"employer": "Company 0"})
+        self.assertEqual(len(found), 6)
+
+        top = self.saver.get_top_vacancies_by_salary(3)
+        self.assertEqual([v['average_salary'] for v in top], [200000.0, 190000.0, 180000.0])
+
+        ranged = self.saver.get_vacancies_by_salary_range(50000, 80000)
+        self.assertEqual([v['average_salary'] for v in ranged], [80000.0, 70000.0, 60000.0, 50000.0])
+
+    def test_process_pool(self):
+        """Тест выполнения запросов в пуле процессов"""
+        with ShardedJSONSaver(self.test_dir, num_shards=4, max_workers=2) as saver:
+            saver.add_vacancies(self.vacancies)
+
+            top = saver.get_top_vacancies_by_salary(2)
+            self.assertEqual([v['average_salary'] for v in top], [200000.0, 190000.0])
+            self.assertEqual(len(saver.get_vacancies()), 20)  # Пул используется повторно
+
+    def test_custom_partition_and_drop(self):
+        """Тест собственной функции разбиения и удаления шарда"""
+        saver = ShardedJSONSaver(self.test_dir, partition=lambda v: v['employer'].replace(" ", "_"),
+                                 max_workers=1)
+        saver.add_vacancies(self.vacancies)
+        self.assertEqual(saver.shards(), ["Company_0", "Company_1", "Company_2"])
+
+        saver.drop_shard("Company_0")
+        self.assertEqual(len(saver.get_vacancies()), 14)
+
+        saver.delete_vacancy(self.vacancies[0])
+        self.assertEqual(len(saver.get_vacancies()), 13)
+
+        saver.clear_file()
+        self.assertEqual(saver.get_vacancies(), [])
+
+    def test_invalid_shard_names(self):
+        """Тест отказа от имен шардов, выходящих за пределы каталога"""
+        saver = ShardedJSONSaver(self.test_dir, partition=lambda v: "../outside", max_workers=1)
+        with self.assertRaises(ValueError):
+            saver.add_vacancy(self.vacancies[0])
+        for shard in ("", "..", "a/b", "a\\b"):
+            with self.assertRaises(ValueError):
+                saver.drop_shard(shard)
+        self.assertFalse(os.path.exists(os.path.join(self.test_dir, "..", "outside.json")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 import sys
 import os
+import pickle
+import subprocess
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
@@ -29,7 +31,7 @@ class TestVacancy(unittest.TestCase):
 
     def test_slots_content(self):
         """Тест содержимого __slots__"""
-        expected_slots = ('title', 'url', 'salary', 'description', 'employer')
+        expected_slots = ('title', 'url', '_salary_from', '_salary_to', '_currency_id', 'description', '_employer_id')
         self.assertEqual(self.vacancy1.__slots__, expected_slots)
 
     def test_memory_efficiency(self):
@@ -37,6 +39,50 @@ class TestVacancy(unittest.TestCase):
         # У объектов с __slots__ не должно быть __dict__
         self.assertFalse(hasattr(self.vacancy1, '__dict__'))
 
+    def test_interned_employer_and_currency(self):
+        """Тест словарного кодирования работодателя и валюты"""
+        vacancy2 = Vacancy("Java Developer", "https://hh.ru/vacancy/124",
+                           {"from": 120000, "to": None, "currency": "RUR"}, "", "Company A")
+
+        self.assertEqual(self.vacancy1._employer_id, vacancy2._employer_id)
+        self.assertEqual(self.vacancy1._currency_id, vacancy2._currency_id)
+        self.assertEqual(vacancy2.employer, "Company A")
+        self.assertEqual(vacancy2.salary, {"from": 120000, "to": 0, "currency": "RUR"})
+
+    def test_to_dict_shape(self):
+        """Тест формата словаря вакансии"""
+        self.assertEqual(self.vacancy1.to_dict(), {
+            "title": "Python Developer",
+            "url": "https://hh.ru/vacancy/123",
+            "salary": {"from": 100000, "to": 150000, "currency": "RUR"},
+            "description": "Разработка на Python, Django",
+            "employer": "Company A",
+            "average_salary": 125000.0
+        })
+
+    def test_salary_is_read_only(self):
+        """Тест запрета изменения элементов словаря зарплаты"""
+        with self.assertRaises(TypeError):
+            self.vacancy1.salary["from"] = 1
+
+        self.vacancy1.salary = {"from": 1, "to": 2, "currency": "USD"}
+        self.assertEqual(self.vacancy1.salary, {"from": 1, "to": 2, "currency": "USD"})
+
+    def test_pickle_in_fresh_process(self):
+        """Тест загрузки pickle в процессе с другими таблицами работодателей и валют"""
+        Vacancy("Other", "https://hh.ru/vacancy/1", {"from": 1, "currency": "KZT"}, "", "Другой работодатель")
+        vacancy = Vacancy("Tester", "https://hh.ru/vacancy/2",
+                          {"from": 5, "to": 7, "currency": "EUR"}, "Описание", "Уникальный работодатель")
+        data = pickle.dumps(vacancy)
+
+        root = os.path.join(os.path.dirname(__file__), '..')
+        code = ("import pickle, sys; v = pickle.loads(sys.stdin.buffer.read()); "
+                "sys.stdout.buffer.write(repr((v.employer, v.salary['currency'], v.salary['to'])).encode())")
+        result = subprocess.run([sys.executable, "-c", code], input=data, capture_output=True, cwd=root, check=True)
+
+        self.assertEqual(result.stdout.decode(), repr(("Уникальный работодатель", "EUR", 7)))
+        self.assertEqual(pickle.loads(data).to_dict(), vacancy.to_dict())
+
     # ... остальные тесты остаются без изменений
 
 